@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Regenerate all enclosure outputs in one go: the laser-cut SVG and the
+printable HTML template. Both run in the same process, so each panel
+shape is built once and shared by the two outputs.
+
+Run: python3 build.py
+Output: enclosure_<timestamp>.svg (+ enclosure_latest.svg), enclosure_print.html
+"""
+
+import enclosure
+import enclosure_print
+
+if __name__ == "__main__":
+    enclosure.main()
+    print()
+    enclosure_print.main()
@@ -9,9 +9,12 @@ Run: python3 enclosure.py
 Output: enclosure_YYYYMMDD_HHMMSS.svg (+ enclosure_latest.svg)
 """
 
-import math
+import functools
+import hashlib
+import io
 import os
-from datetime import datetime
+import shutil
+import time
 
 # ============================================================
 # INPUTS — tweak these to change the enclosure
@@ -71,24 +74,43 @@ DISP_CY = CAM_ZONE + DISP_H / 2
 # Camera position (centered horizontally)
 CAM_CX = W / 2
 
+# Finger profiles as (grow, depth): tabs protrude by T and are widened by
+# burn; slots are cut in by T and narrowed by burn
+TAB = (BURN, T)
+SLOT = (-BURN, -T)
+
+# Pi 5 mounting hole offsets from the board's top-left corner
+PI_HOLE_OFFSETS = tuple(
+    (PI_HOLE_INSET_X + sx, PI_HOLE_INSET_Y + sy)
+    for sx in (0, PI_HOLE_SPACING_X)
+    for sy in (0, PI_HOLE_SPACING_Y)
+)
+
+# Burn compensation applied to a hole's size: holes shrink
+HOLE_DELTA = -2 * BURN
+
+# rounded_rect doesn't clamp its radius, so check the window's here once
+if not 0 <= DISP_R <= min(DISP_W, DISP_H) / 2 + HOLE_DELTA / 2:
+    raise ValueError(f"DISP_R={DISP_R} doesn't fit a {DISP_W} x {DISP_H} mm window")
+
 # SVG layout
 SPACING = 15
 
+# Build each panel once at (0, 0) and place copies with translate groups.
+# Off by default: the cut file stays flat absolute paths, since some laser
+# and slicer importers ignore group transforms (see USE_SVG_DEFS in v1).
+USE_SVG_TRANSLATE = False
+
 
 # ============================================================
 # Utility functions
 # ============================================================
 
+@functools.lru_cache(maxsize=None)
 def fmt(v):
-    """Format a float for SVG, removing trailing zeros."""
-    return f"{v:.3f}".rstrip('0').rstrip('.')
-
-
-def burn_offset(nominal, is_hole):
-    """Apply burn compensation. Holes shrink, tabs/outer features grow."""
-    if is_hole:
-        return nominal - 2 * BURN
-    return nominal + 2 * BURN
+    """Format a float for SVG, removing trailing zeros.
+    Memoized: the same coordinates recur across edges, panels and pages."""
+    return f"{v:.2f}".rstrip('0').rstrip('.')
 
 
 def corner_relief(cx, cy):
@@ -99,23 +121,21 @@ def corner_relief(cx, cy):
             f"A{fmt(r)},{fmt(r)} 0 1,1 {fmt(cx - r)},{fmt(cy)}Z")
 
 
-def circle_path(cx, cy, d, is_hole=True):
-    """SVG path for a circle. Apply burn compensation."""
-    r = burn_offset(d, is_hole) / 2
+def circle(cx, cy, r):
+    """SVG path for a circle of radius r (two arcs), no compensation."""
     return (f"M{fmt(cx - r)},{fmt(cy)} "
             f"A{fmt(r)},{fmt(r)} 0 1,0 {fmt(cx + r)},{fmt(cy)} "
             f"A{fmt(r)},{fmt(r)} 0 1,0 {fmt(cx - r)},{fmt(cy)}Z")
 
 
-def rounded_rect_path(cx, cy, w, h, r, is_hole=True):
-    """SVG path for a rounded rectangle centered at (cx, cy)."""
-    if is_hole:
-        w = w - 2 * BURN
-        h = h - 2 * BURN
-    else:
-        w = w + 2 * BURN
-        h = h + 2 * BURN
-    r = max(0, min(r, w / 2, h / 2))
+def circle_hole(cx, cy, d):
+    """SVG path for a circular hole, with the hole burn delta folded in."""
+    return circle(cx, cy, (d + HOLE_DELTA) / 2)
+
+
+def rounded_rect(cx, cy, w, h, r):
+    """SVG path for a rounded rectangle centered at (cx, cy), no compensation.
+    The corner radius must already fit: 0 <= r <= min(w, h) / 2."""
     x0, y0 = cx - w / 2, cy - h / 2
     x1, y1 = cx + w / 2, cy + h / 2
     return (f"M{fmt(x0 + r)},{fmt(y0)} "
@@ -125,10 +145,21 @@ def rounded_rect_path(cx, cy, w, h, r, is_hole=True):
             f"L{fmt(x0)},{fmt(y0 + r)} A{fmt(r)},{fmt(r)} 0 0,1 {fmt(x0 + r)},{fmt(y0)}Z")
 
 
+def rrect_hole(cx, cy, w, h, r):
+    """SVG path for a rounded-rectangle hole, with the hole burn delta folded in."""
+    return rounded_rect(cx, cy, w + HOLE_DELTA, h + HOLE_DELTA, r)
+
+
+def line_to(out, pts):
+    """Append an L command for every (x, y) in pts to the `out` list,
+    formatting the whole batch in one pass."""
+    out.extend([f"L{fmt(x)},{fmt(y)}" for x, y in pts])
+
+
 def rect_cutout(cx, cy, w, h):
     """SVG path for a rectangular hole (burn-compensated inward)."""
-    w = w - 2 * BURN
-    h = h - 2 * BURN
+    w = w + HOLE_DELTA
+    h = h + HOLE_DELTA
     x, y = cx - w / 2, cy - h / 2
     return (f"M{fmt(x)},{fmt(y)} L{fmt(x + w)},{fmt(y)} "
             f"L{fmt(x + w)},{fmt(y + h)} L{fmt(x)},{fmt(y + h)}Z")
@@ -138,6 +169,7 @@ def rect_cutout(cx, cy, w, h):
 # Finger joint generation
 # ============================================================
 
+@functools.lru_cache(maxsize=32)
 def calc_fingers(length, tab_width=TAB_W):
     """Calculate number of fingers for an edge. Always odd count,
     starting and ending with a gap (no-tab) so corners stay solid."""
@@ -148,151 +180,154 @@ def calc_fingers(length, tab_width=TAB_W):
     return n, seg_w
 
 
-def finger_tab_edge(x1, y1, x2, y2):
-    """Edge with tabs protruding outward (for walls mating into front plate slots).
-    Tabs are at odd indices (1, 3, 5...). Even indices are gaps (baseline)."""
-    dx, dy = x2 - x1, y2 - y1
-    length = math.hypot(dx, dy)
-    ux, uy = dx / length, dy / length
-    # Perpendicular pointing outward (for CW winding)
-    px, py = dy / length, -dx / length
-
-    n, seg_w = calc_fingers(length)
-    b = BURN  # burn compensation
-
-    segs = []
-    for i in range(n):
-        s_start = i * seg_w
-        s_end = (i + 1) * seg_w
-
-        sx = x1 + ux * s_start
-        sy = y1 + uy * s_start
-        ex = x1 + ux * s_end
-        ey = y1 + uy * s_end
-
-        if i % 2 == 1:
-            # Tab: extend outward by T, widen by burn on each side
-            tab_sx = sx[0] if isinstance(sx, tuple) else sx
-            # Tab start: move back by burn along edge, then out by T
-            tsx = sx - ux * b + px * T
-            tsy = sy - uy * b + py * T
-            tex = ex + ux * b + px * T
-            tey = ey + uy * b + py * T
-            ex2 = ex + ux * b
-            ey2 = ey + uy * b
-            sx2 = sx - ux * b
-            sy2 = sy - uy * b
-
-            segs.append(f"L{fmt(sx2)},{fmt(sy2)}")
-            segs.append(f"L{fmt(tsx)},{fmt(tsy)}")
-            segs.append(f"L{fmt(tex)},{fmt(tey)}")
-            segs.append(f"L{fmt(ex2)},{fmt(ey2)}")
-        else:
-            segs.append(f"L{fmt(ex)},{fmt(ey)}")
-
-    return " ".join(segs)
+@functools.lru_cache(maxsize=32)
+def edge_frame(dx, dy):
+    """Length, unit direction and outward perpendicular (for CW winding)
+    of an edge vector. Memoized: every panel reuses a handful of edges.
+    All enclosure edges are axis-aligned, so the length is |dx| + |dy|."""
+    assert dx == 0 or dy == 0, "finger edges must be axis-aligned"
+    length = abs(dx) + abs(dy)
+    return length, dx / length, dy / length, dy / length, -dx / length
 
 
-def finger_slot_edge(x1, y1, x2, y2):
-    """Edge with slots cut inward (for front plate receiving wall tabs).
-    Slots are at odd indices, matching tab positions on mating wall."""
-    dx, dy = x2 - x1, y2 - y1
-    length = math.hypot(dx, dy)
-    ux, uy = dx / length, dy / length
-    px, py = dy / length, -dx / length
+def finger_points(x1, y1, x2, y2, grow, depth):
+    """Corner coordinates of a finger-jointed edge, as a list of (x, y).
 
+    Fingers are at odd indices, gaps at even indices. Each finger is widened
+    by `grow` at both ends along the edge and offset by `depth` along the
+    outward perpendicular (CW winding). Negative values give a slot: narrowed
+    and cut inward. The start point (x1, y1) is not included."""
+    length, ux, uy, px, py = edge_frame(x2 - x1, y2 - y1)
     n, seg_w = calc_fingers(length)
-    b = BURN
-
-    segs = []
-    for i in range(n):
-        s_start = i * seg_w
-        s_end = (i + 1) * seg_w
-
-        sx = x1 + ux * s_start
-        sy = y1 + uy * s_start
-        ex = x1 + ux * s_end
-        ey = y1 + uy * s_end
-
-        if i % 2 == 1:
-            # Slot: cut inward by T, narrowed by burn on each side
-            ssx = sx + ux * b - px * T
-            ssy = sy + uy * b - py * T
-            sex = ex - ux * b - px * T
-            sey = ey - uy * b - py * T
-            sx2 = sx + ux * b
-            sy2 = sy + uy * b
-            ex2 = ex - ux * b
-            ey2 = ey - uy * b
-
-            segs.append(f"L{fmt(sx2)},{fmt(sy2)}")
-            segs.append(f"L{fmt(ssx)},{fmt(ssy)}")
-            segs.append(f"L{fmt(sex)},{fmt(sey)}")
-            segs.append(f"L{fmt(ex2)},{fmt(ey2)}")
-        else:
-            segs.append(f"L{fmt(ex)},{fmt(ey)}")
 
-    return " ".join(segs)
+    # Segment boundaries along the edge, computed once (n + 1 points)
+    xs = [x1 + ux * (i * seg_w) for i in range(n + 1)]
+    ys = [y1 + uy * (i * seg_w) for i in range(n + 1)]
+
+    # Fingers and gaps strictly alternate, so walk the fingers only: each
+    # contributes its four corners plus the end of the gap that follows.
+    pts = [(xs[1], ys[1])]
+    for i in range(1, n, 2):
+        # Finger: move back by grow along edge, then out by depth
+        sx2 = xs[i] - ux * grow
+        sy2 = ys[i] - uy * grow
+        ex2 = xs[i + 1] + ux * grow
+        ey2 = ys[i + 1] + uy * grow
+
+        pts += (
+            (sx2, sy2),
+            (sx2 + px * depth, sy2 + py * depth),
+            (ex2 + px * depth, ey2 + py * depth),
+            (ex2, ey2),
+            (xs[i + 2], ys[i + 2]),
+        )
+
+    return pts
 
 
 # ============================================================
 # Panel generators
 # ============================================================
 
+def outline_points(ox, oy, w, h, edges, inset=0):
+    """Corner coordinates of a finger-jointed w x h outline, traced
+    clockwise from (ox, oy), as one list of (x, y) for the whole panel.
+
+    `edges` gives the finger profile (TAB or SLOT) for the top, right,
+    bottom and left edges in that order. `inset` keeps that much solid
+    material at both ends of the top and bottom edges."""
+    corners = ((ox, oy), (ox + w, oy), (ox + w, oy + h), (ox, oy + h), (ox, oy))
+    pts = []
+    for i, (grow, depth) in enumerate(edges):
+        (x1, y1), (x2, y2) = corners[i], corners[i + 1]
+        if inset and i % 2 == 0:
+            d = inset if x2 > x1 else -inset
+            pts.append((x1 + d, y1))
+            pts.extend(finger_points(x1 + d, y1, x2 - d, y2, grow, depth))
+            pts.append((x2, y2))
+        else:
+            pts.extend(finger_points(x1, y1, x2, y2, grow, depth))
+    return pts
+
+
+def drop_collinear(pts):
+    """Remove points that sit on a straight axis-aligned run between their
+    neighbours, so each straight stretch of cut is a single segment.
+    The first and last points are always kept."""
+    keep = [pts[0]]
+    for i in range(1, len(pts) - 1):
+        (ax, ay), (bx, by), (cx, cy) = keep[-1], pts[i], pts[i + 1]
+        if ax == bx == cx or ay == by == cy:
+            continue
+        keep.append(pts[i])
+    keep.append(pts[-1])
+    return keep
+
+
+def outline(out, ox, oy, w, h, edges, inset=0):
+    """Append a closed finger-jointed outline (see outline_points) to `out`.
+    Geometry for the whole panel is computed first, then formatted once.
+    Redundant collinear vertices are dropped, and the closing point is
+    left to Z rather than cut as a separate zero-length segment."""
+    pts = drop_collinear([(ox, oy)] + outline_points(ox, oy, w, h, edges, inset))
+    if pts[-1] == pts[0]:
+        pts.pop()
+    out.append(f"M{fmt(ox)},{fmt(oy)}")
+    line_to(out, pts[1:])
+    out[-1] += "Z"
+
+
+def at_origin(panel_fn):
+    """Decorator: with USE_SVG_TRANSLATE, build the panel once at (0, 0) and
+    place each copy with a translate group, so the layout SVG and the print
+    pages share a single string. Otherwise draw it flat at (ox, oy)."""
+    shape = functools.lru_cache(maxsize=1)(lambda: panel_fn(0, 0))
+
+    @functools.wraps(panel_fn)
+    def place(ox, oy):
+        if not USE_SVG_TRANSLATE:
+            return panel_fn(ox, oy)
+        return f'<g transform="translate({fmt(ox)},{fmt(oy)})">{shape()}</g>'
+    return place
+
+
+def plate_outline(ox, oy, w, h):
+    """Slotted outline shared by the front and back plates. Slots on all 4
+    edges; top/bottom edges have T inset (solid corners where side walls
+    sit), slots only in middle W portion."""
+    parts = []
+    outline(parts, ox, oy, w, h, (SLOT,) * 4, inset=T)
+    return " ".join(parts)
+
+
+@at_origin
 def front_plate(ox, oy):
     """Front plate (OW x OH): display window, camera hole.
     Finger joint SLOTS on all 4 edges. Top/bottom edges have T inset
     (solid corners where side walls sit), slots only in middle W portion."""
-    w, h = OW, OH
-
-    path = f"M{fmt(ox)},{fmt(oy)}"
-    # Top edge (L to R): T solid + W slots + T solid
-    path += f" L{fmt(ox + T)},{fmt(oy)}"
-    path += " " + finger_slot_edge(ox + T, oy, ox + T + W, oy)
-    path += f" L{fmt(ox + w)},{fmt(oy)}"
-    # Right edge (top to bottom): full slots for side wall
-    path += " " + finger_slot_edge(ox + w, oy, ox + w, oy + h)
-    # Bottom edge (R to L): T solid + W slots + T solid
-    path += f" L{fmt(ox + w - T)},{fmt(oy + h)}"
-    path += " " + finger_slot_edge(ox + w - T, oy + h, ox + T, oy + h)
-    path += f" L{fmt(ox)},{fmt(oy + h)}"
-    # Left edge (bottom to top): full slots for side wall
-    path += " " + finger_slot_edge(ox, oy + h, ox, oy)
-    path += "Z"
+    parts = [plate_outline(ox, oy, OW, OH)]
 
     # Display window (centered in internal area, offset for front plate coords)
     win_cx = ox + T + DISP_CX
     win_cy = oy + T + DISP_CY
-    window = rounded_rect_path(win_cx, win_cy, DISP_W, DISP_H, DISP_R, is_hole=True)
+    parts.append(rrect_hole(win_cx, win_cy, DISP_W, DISP_H, DISP_R))
 
     # Camera hole
     cam_cx = ox + T + CAM_CX
     cam_cy = oy + T + CAM_CY
-    camera = circle_path(cam_cx, cam_cy, CAM_D, is_hole=True)
+    parts.append(circle_hole(cam_cx, cam_cy, CAM_D))
 
-    return f'<path d="{path} {window} {camera}" fill-rule="evenodd"/>'
+    return f'<path d="{" ".join(parts)}" fill-rule="evenodd"/>'
 
 
+@at_origin
 def back_plate(ox, oy):
     """Back plate (OW x OH): finger joint slots on all 4 edges (mirrors front),
     attaches with hinges. Pi 5 mounting holes."""
     w, h = BACK_W, BACK_H
 
     # Outline with finger slots — top/bottom inset like front plate
-    path = f"M{fmt(ox)},{fmt(oy)}"
-    # Top edge: T solid + W slots + T solid
-    path += f" L{fmt(ox + T)},{fmt(oy)}"
-    path += " " + finger_slot_edge(ox + T, oy, ox + T + W, oy)
-    path += f" L{fmt(ox + w)},{fmt(oy)}"
-    # Right edge: full slots for side wall
-    path += " " + finger_slot_edge(ox + w, oy, ox + w, oy + h)
-    # Bottom edge: T solid + W slots + T solid
-    path += f" L{fmt(ox + w - T)},{fmt(oy + h)}"
-    path += " " + finger_slot_edge(ox + w - T, oy + h, ox + T, oy + h)
-    path += f" L{fmt(ox)},{fmt(oy + h)}"
-    # Left edge: full slots for side wall
-    path += " " + finger_slot_edge(ox, oy + h, ox, oy)
-    path += "Z"
+    parts = [plate_outline(ox, oy, w, h)]
 
     # Pi 5 mounting holes — centered in back plate
     pi_w = 85.0   # Pi board width
@@ -300,89 +335,67 @@ def back_plate(ox, oy):
     pi_cx = ox + w / 2
     pi_cy = oy + w / 2 + 14  # offset down (below display center) to avoid camera zone
 
-    holes = []
-    for dx in [PI_HOLE_INSET_X, PI_HOLE_INSET_X + PI_HOLE_SPACING_X]:
-        for dy in [PI_HOLE_INSET_Y, PI_HOLE_INSET_Y + PI_HOLE_SPACING_Y]:
-            hx = pi_cx - pi_w / 2 + dx
-            hy = pi_cy - pi_h / 2 + dy
-            holes.append(circle_path(hx, hy, PI_HOLE_D, is_hole=True))
+    for dx, dy in PI_HOLE_OFFSETS:
+        hx = pi_cx - pi_w / 2 + dx
+        hy = pi_cy - pi_h / 2 + dy
+        parts.append(circle_hole(hx, hy, PI_HOLE_D))
 
-    cuts = " ".join(holes)
-    return f'<path d="{path} {cuts}" fill-rule="evenodd"/>'
+    return f'<path d="{" ".join(parts)}" fill-rule="evenodd"/>'
 
 
+@at_origin
 def top_wall(ox, oy):
     """Top wall (W x D): fits between side walls. Tabs on all edges —
     long edges into front/back plates, short edges into side wall slots."""
-    w, h = W, D
-
-    path = f"M{fmt(ox)},{fmt(oy)}"
-    # Back edge (top in SVG): tabs (mates with back plate slots)
-    path += " " + finger_tab_edge(ox, oy, ox + w, oy)
-    # Right edge: tabs (into right side wall slots)
-    path += " " + finger_tab_edge(ox + w, oy, ox + w, oy + h)
-    # Front edge (bottom in SVG): tabs (mates with front plate slots)
-    path += " " + finger_tab_edge(ox + w, oy + h, ox, oy + h)
-    # Left edge: tabs (into left side wall slots)
-    path += " " + finger_tab_edge(ox, oy + h, ox, oy)
-    path += "Z"
-
-    return f'<path d="{path}"/>'
+    parts = []
+    outline(parts, ox, oy, W, D, (TAB,) * 4)
+    return f'<path d="{" ".join(parts)}"/>'
 
 
+@at_origin
 def bottom_wall(ox, oy):
     """Bottom wall (W x D): fits between side walls. Tabs on all edges —
     long edges into front/back plates, short edges into side wall slots + USB-C cutout."""
-    w, h = W, D
-
-    path = f"M{fmt(ox)},{fmt(oy)}"
-    # Back edge: tabs (mates with back plate slots)
-    path += " " + finger_tab_edge(ox, oy, ox + w, oy)
-    # Right edge: tabs (into right side wall slots)
-    path += " " + finger_tab_edge(ox + w, oy, ox + w, oy + h)
-    # Front edge: tabs (mates with front plate slots)
-    path += " " + finger_tab_edge(ox + w, oy + h, ox, oy + h)
-    # Left edge: tabs (into left side wall slots)
-    path += " " + finger_tab_edge(ox, oy + h, ox, oy)
-    path += "Z"
+    parts = []
+    outline(parts, ox, oy, W, D, (TAB,) * 4)
 
     # USB-C cutout centered horizontally, centered in wall depth
-    usb_cx = ox + w / 2
-    usb_cy = oy + h / 2
-    usb = rect_cutout(usb_cx, usb_cy, USB_W, USB_H)
+    usb_cx = ox + W / 2
+    usb_cy = oy + D / 2
+    parts.append(rect_cutout(usb_cx, usb_cy, USB_W, USB_H))
+
+    return f'<path d="{" ".join(parts)}" fill-rule="evenodd"/>'
+
 
-    return f'<path d="{path} {usb}" fill-rule="evenodd"/>'
+def side_outline(ox, oy):
+    """Outline shared by the left and right walls."""
+    parts = []
+    # Back/front edges (top/bottom in SVG): tabs into plate slots.
+    # Box top/bottom edges (left/right in SVG): slots receive wall tabs.
+    outline(parts, ox, oy, OH, D, (TAB, SLOT, TAB, SLOT))
+    return " ".join(parts)
 
 
 def side_wall_path(ox, oy, button=False):
     """Side wall (OH x D): tabs on long edges (front/back plates),
     slots on short edges (receive top/bottom wall tabs). Optional button hole."""
-    w, h = OH, D
-
-    path = f"M{fmt(ox)},{fmt(oy)}"
-    # Back edge (top in SVG): tabs (mates with back plate slots)
-    path += " " + finger_tab_edge(ox, oy, ox + w, oy)
-    # Bottom-of-box edge (right in SVG): slots (receive bottom wall tabs)
-    path += " " + finger_slot_edge(ox + w, oy, ox + w, oy + h)
-    # Front edge (bottom in SVG, R to L): tabs (mates with front plate slots)
-    path += " " + finger_tab_edge(ox + w, oy + h, ox, oy + h)
-    # Top-of-box edge (left in SVG): slots (receive top wall tabs)
-    path += " " + finger_slot_edge(ox, oy + h, ox, oy)
-    path += "Z"
+    parts = [side_outline(ox, oy)]
 
     if button:
-        btn_cx = ox + w / 2   # centered vertically (along height)
-        btn_cy = oy + h / 2   # centered in depth
-        btn = circle_path(btn_cx, btn_cy, BTN_D, is_hole=True)
-        return f'<path d="{path} {btn}" fill-rule="evenodd"/>'
-    return f'<path d="{path}"/>'
+        btn_cx = ox + OH / 2   # centered vertically (along height)
+        btn_cy = oy + D / 2    # centered in depth
+        parts.append(circle_hole(btn_cx, btn_cy, BTN_D))
+        return f'<path d="{" ".join(parts)}" fill-rule="evenodd"/>'
+    return f'<path d="{" ".join(parts)}"/>'
 
 
+@at_origin
 def left_wall(ox, oy):
     """Left wall, no button."""
     return side_wall_path(ox, oy, button=False)
 
 
+@at_origin
 def right_wall(ox, oy):
     """Right wall with button hole."""
     return side_wall_path(ox, oy, button=True)
@@ -392,51 +405,80 @@ def right_wall(ox, oy):
 # Dimension legend
 # ============================================================
 
+# Legend text depends only on the module constants, so it is built once
+# at import; only the placement varies per call.
+LEGEND_LINES = (
+    f"E-INK CAMERA ENCLOSURE",
+    f"",
+    f"Box (outer):  {OW:.1f} x {OH:.1f} x {D + 2*T:.1f} mm  "
+        f"({OW/25.4:.2f} x {OH/25.4:.2f} x {(D+2*T)/25.4:.2f} in)  "
+        f"({OW/10:.1f} x {OH/10:.1f} x {(D+2*T)/10:.1f} cm)",
+    f"Box (inner):  {W:.1f} x {H:.1f} x {D:.1f} mm",
+    f"Material:     {T:.1f}mm plywood, burn comp: {BURN}mm",
+    f"",
+    f"PANELS",
+    f"  Front plate:   {OW:.1f} x {OH:.1f} mm",
+    f"  Back plate:    {BACK_W:.1f} x {BACK_H:.1f} mm",
+    f"  Top wall:      {W:.1f} x {D:.1f} mm  (fits between side walls)",
+    f"  Bottom wall:   {W:.1f} x {D:.1f} mm  (fits between side walls)",
+    f"  Left wall:     {OH:.1f} x {D:.1f} mm",
+    f"  Right wall:    {OH:.1f} x {D:.1f} mm",
+    f"",
+    f"FEATURES",
+    f"  Display window:  {DISP_W} x {DISP_H} mm  (r={DISP_R}mm)",
+    f"  Camera hole:     {CAM_D}mm dia  ({CAM_CY}mm from top)",
+    f"  Camera zone:     {CAM_ZONE}mm above display",
+    f"  Button hole:     {BTN_D}mm dia  (right wall)",
+    f"  USB-C cutout:    {USB_W} x {USB_H} mm  (bottom wall)",
+)
+LEGEND_LINE_H = 5  # mm line height
+
+# (y offset, weight attribute, text) per legend line
+_LEGEND_ROWS = tuple(
+    (i * LEGEND_LINE_H,
+     'font-weight="bold"' if line and not line.startswith(" ") else "",
+     line)
+    for i, line in enumerate(LEGEND_LINES)
+)
+
+
+@functools.lru_cache(maxsize=4)
 def dimension_legend(ox, oy):
     """Generate SVG text block showing all dimensions."""
-    lines = [
-        f"E-INK CAMERA ENCLOSURE",
-        f"",
-        f"Box (outer):  {OW:.1f} x {OH:.1f} x {D + 2*T:.1f} mm  "
-            f"({OW/25.4:.2f} x {OH/25.4:.2f} x {(D+2*T)/25.4:.2f} in)  "
-            f"({OW/10:.1f} x {OH/10:.1f} x {(D+2*T)/10:.1f} cm)",
-        f"Box (inner):  {W:.1f} x {H:.1f} x {D:.1f} mm",
-        f"Material:     {T:.1f}mm plywood, burn comp: {BURN}mm",
-        f"",
-        f"PANELS",
-        f"  Front plate:   {OW:.1f} x {OH:.1f} mm",
-        f"  Back plate:    {BACK_W:.1f} x {BACK_H:.1f} mm",
-        f"  Top wall:      {W:.1f} x {D:.1f} mm  (fits between side walls)",
-        f"  Bottom wall:   {W:.1f} x {D:.1f} mm  (fits between side walls)",
-        f"  Left wall:     {OH:.1f} x {D:.1f} mm",
-        f"  Right wall:    {OH:.1f} x {D:.1f} mm",
-        f"",
-        f"FEATURES",
-        f"  Display window:  {DISP_W} x {DISP_H} mm  (r={DISP_R}mm)",
-        f"  Camera hole:     {CAM_D}mm dia  ({CAM_CY}mm from top)",
-        f"  Camera zone:     {CAM_ZONE}mm above display",
-        f"  Button hole:     {BTN_D}mm dia  (right wall)",
-        f"  USB-C cutout:    {USB_W} x {USB_H} mm  (bottom wall)",
-    ]
-
-    text_elements = []
-    line_h = 5  # mm line height
-    for i, line in enumerate(lines):
-        y = oy + i * line_h
-        weight = 'font-weight="bold"' if line and not line.startswith(" ") else ""
-        text_elements.append(
-            f'<text x="{fmt(ox)}" y="{fmt(y)}" {weight}>{line}</text>'
-        )
-
-    return "\n    ".join(text_elements)
+    x = fmt(ox)
+    return "\n    ".join(
+        f'<text x="{x}" y="{fmt(oy + dy)}" {weight}>{line}</text>'
+        for dy, weight, line in _LEGEND_ROWS
+    )
 
 
 # ============================================================
 # SVG generation
 # ============================================================
 
-def generate_svg():
-    """Lay out all 6 panels + dimension legend and generate SVG."""
+# Document envelope, written around the panel and legend content
+_SVG_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     width="{w}mm" height="{h}mm"
+     viewBox="0 0 {w} {h}">
+  <!-- Laser-cut enclosure for e-ink camera -->
+  <!-- Red = cut, Blue = engrave/score -->
+  <!-- Units: mm. Material: {T}mm plywood. Burn: {BURN}mm -->
+  <g fill="none" stroke="red" stroke-width="0.1">
+    '''
+_SVG_LEGEND = '''
+  </g>
+  <g fill="#444" stroke="none" font-family="monospace" font-size="3.5">
+    '''
+_SVG_FOOTER = '''
+  </g>
+</svg>'''
+
+
+def write_svg(write):
+    """Lay out all 6 panels + dimension legend and stream the SVG to `write`
+    (e.g. a file's write method) piece by piece, without building the
+    whole document in memory."""
     sp = SPACING
     margin = T + 1  # extra margin for protruding finger tabs
 
@@ -457,67 +499,98 @@ def generate_svg():
     r2_w = margin + W + sp + W + margin
     r3_w = margin + OH + sp + OH + margin
     total_w = max(r1_w, r2_w, r3_w) + 2 * sp
-    total_h = legend_y + 20 * 5 + sp  # 20 lines of legend
+    total_h = legend_y + len(LEGEND_LINES) * LEGEND_LINE_H + sp
 
     # X offsets: center each row, or just use consistent left margin
     x0 = sp + margin
 
-    parts = [
-        f'<!-- Front Plate {OW:.0f}x{OH:.0f}mm -->',
-        front_plate(x0, r1_y),
-
-        f'<!-- Back Plate {BACK_W:.0f}x{BACK_H:.0f}mm -->',
-        back_plate(x0 + OW + sp, r1_y),
-
-        f'<!-- Top Wall {W:.0f}x{D:.0f}mm -->',
-        top_wall(x0, r2_y),
-
-        f'<!-- Bottom Wall {W:.0f}x{D:.0f}mm -->',
-        bottom_wall(x0 + W + sp, r2_y),
-
-        f'<!-- Left Wall {OH:.0f}x{D:.0f}mm -->',
-        left_wall(x0, r3_y),
-
-        f'<!-- Right Wall {OH:.0f}x{D:.0f}mm -->',
-        right_wall(x0 + OH + sp, r3_y),
+    panels = [
+        (f'<!-- Front Plate {OW:.0f}x{OH:.0f}mm -->', front_plate, x0, r1_y),
+        (f'<!-- Back Plate {BACK_W:.0f}x{BACK_H:.0f}mm -->', back_plate, x0 + OW + sp, r1_y),
+        (f'<!-- Top Wall {W:.0f}x{D:.0f}mm -->', top_wall, x0, r2_y),
+        (f'<!-- Bottom Wall {W:.0f}x{D:.0f}mm -->', bottom_wall, x0 + W + sp, r2_y),
+        (f'<!-- Left Wall {OH:.0f}x{D:.0f}mm -->', left_wall, x0, r3_y),
+        (f'<!-- Right Wall {OH:.0f}x{D:.0f}mm -->', right_wall, x0 + OH + sp, r3_y),
     ]
 
-    content = "\n    ".join(parts)
-    legend = dimension_legend(x0, legend_y)
-
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     width="{fmt(total_w)}mm" height="{fmt(total_h)}mm"
-     viewBox="0 0 {fmt(total_w)} {fmt(total_h)}">
-  <!-- Laser-cut enclosure for e-ink camera -->
-  <!-- Red = cut, Blue = engrave/score -->
-  <!-- Units: mm. Material: {T}mm plywood. Burn: {BURN}mm -->
-  <g fill="none" stroke="red" stroke-width="0.1">
-    {content}
-  </g>
-  <g fill="#444" stroke="none" font-family="monospace" font-size="3.5">
-    {legend}
-  </g>
-</svg>'''
+    write(_SVG_HEADER.format_map({
+        "w": fmt(total_w), "h": fmt(total_h), "T": T, "BURN": BURN,
+    }))
+    for i, (comment, draw_fn, px, py) in enumerate(panels):
+        if i:
+            write("\n    ")
+        write(comment)
+        write("\n    ")
+        write(draw_fn(px, py))
+    write(_SVG_LEGEND)
+    write(dimension_legend(x0, legend_y))
+    write(_SVG_FOOTER)
+
+
+@functools.lru_cache(maxsize=1)
+def generate_svg():
+    """Generate the full SVG as a string. Cached: the inputs are module
+    constants fixed at import, so repeated calls return the same document."""
+    buf = io.StringIO()
+    write_svg(buf.write)
+    return buf.getvalue()
+
+
+def content_hash(text):
+    """Short digest of a document, to detect unchanged output."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def update_latest(versioned, latest):
+    """Point `latest` at `versioned`, swapping it in atomically. Where
+    symlinks aren't available (e.g. Windows without developer mode),
+    `latest` becomes a plain copy instead."""
+    if os.path.islink(latest) and os.readlink(latest) == versioned:
+        return
+
+    tmp = latest + ".tmp"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    try:
+        os.symlink(versioned, tmp)
+        linked = True
+    except OSError:
+        shutil.copyfile(versioned, tmp)
+        linked = False
+    os.replace(tmp, latest)
+
+    if linked:
+        print(f"Linked   {latest} -> {versioned}")
+    else:
+        print(f"Copied   {versioned} -> {latest} (symlinks unavailable)")
 
 
-if __name__ == "__main__":
+def main():
+    """Write a versioned SVG and point enclosure_latest.svg at it."""
     svg = generate_svg()
-
-    # Versioned output
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    versioned = f"enclosure_{ts}.svg"
-    with open(versioned, "w") as f:
-        f.write(svg)
-
-    # Latest symlink
     latest = "enclosure_latest.svg"
-    if os.path.islink(latest) or os.path.exists(latest):
-        os.remove(latest)
-    os.symlink(versioned, latest)
 
-    print(f"Generated {versioned}")
-    print(f"Linked   {latest} -> {versioned}")
+    unchanged = False
+    if os.path.exists(latest):
+        with open(latest) as f:
+            unchanged = content_hash(f.read()) == content_hash(svg)
+
+    if unchanged:
+        print(f"Unchanged: {latest} -> {os.path.realpath(latest)}")
+    else:
+        # Versioned output, written to a temp file and renamed into place
+        ts = time.strftime("%Y%m%d_%H%M%S")
+        versioned = f"enclosure_{ts}.svg"
+        with open(versioned + ".tmp", "w") as f:
+            f.write(svg)
+        os.replace(versioned + ".tmp", versioned)
+
+        print(f"Generated {versioned}")
+        update_latest(versioned, latest)
     print(f"\nBox: {OW/10:.1f} x {OH/10:.1f} x {(D+2*T)/10:.1f} cm "
           f"({OW:.0f} x {OH:.0f} x {D+2*T:.0f} mm)")
     print(f"Internal: {W} x {H:.1f} x {D} mm")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ on separate letter-size pages. Print with "Actual size" (no scaling).
 Run: python3 enclosure_print.py && open enclosure_print.html
 """
 
+import functools
+
 from enclosure import *
 
 MARGIN = 25  # viewBox margin around each panel (mm) — room for dims + text
@@ -44,24 +46,10 @@ def v_dim(x, y1, y2, label, left=True):
     </g>'''
 
 
-def panel_page(title, draw_fn, pw, ph, extra_dims=""):
-    """One panel as a full SVG with dimensions."""
-    m = MARGIN
-    vb_w = pw + 2 * m
-    vb_h = ph + 2 * m
-    ox, oy = m, m
-
-    panel_el = draw_fn(ox, oy)
-
-    # Standard width and height dimensions
-    dims = h_dim(ox, ox + pw, oy, f"{pw:.4g}mm", above=True)
-    dims += "\n    " + v_dim(ox, oy, oy + ph, f"{ph:.4g}mm", left=True)
-    if extra_dims:
-        dims += "\n    " + extra_dims
-
-    return f'''<svg xmlns="http://www.w3.org/2000/svg"
-         width="{fmt(vb_w)}mm" height="{fmt(vb_h)}mm"
-         viewBox="0 0 {fmt(vb_w)} {fmt(vb_h)}"
+# One panel page; filled per panel with str.format_map
+_PAGE_TMPL = '''<svg xmlns="http://www.w3.org/2000/svg"
+         width="{w}mm" height="{h}mm"
+         viewBox="0 0 {w} {h}"
          style="max-width:100%; max-height:250mm;" overflow="visible">
       <defs>
         <marker id="arr" markerWidth="3" markerHeight="3" refX="1.5" refY="1.5"
@@ -69,52 +57,89 @@ def panel_page(title, draw_fn, pw, ph, extra_dims=""):
           <path d="M0,0 L3,1.5 L0,3Z" fill="#333"/>
         </marker>
       </defs>
-      <text x="{fmt(vb_w/2)}" y="{fmt(m/2)}" font-size="4.5" text-anchor="middle"
+      <text x="{title_x}" y="{title_y}" font-size="4.5" text-anchor="middle"
             font-family="sans-serif" font-weight="bold" fill="#333">{title}</text>
       <g fill="none" stroke="red" stroke-width="0.2">
-        {panel_el}
+        {panel}
       </g>
       {dims}
     </svg>'''
 
 
+@functools.lru_cache(maxsize=8)
+def page_fields(pw, ph):
+    """Template fields that depend only on the panel size: page size,
+    title position and the standard width/height dimensions. Cached,
+    since the walls share sizes and every page reuses its own."""
+    m = MARGIN
+    vb_w = pw + 2 * m
+    vb_h = ph + 2 * m
+    ox, oy = m, m
+
+    # Standard width and height dimensions
+    dims = "\n    ".join([
+        h_dim(ox, ox + pw, oy, f"{pw:.4g}mm", above=True),
+        v_dim(ox, oy, oy + ph, f"{ph:.4g}mm", left=True),
+    ])
+
+    return {
+        "w": fmt(vb_w), "h": fmt(vb_h),
+        "title_x": fmt(vb_w / 2), "title_y": fmt(m / 2), "dims": dims,
+    }
+
+
+def panel_page(title, panel_el, pw, ph, extra_dims=""):
+    """One panel as a full SVG with dimensions. `panel_el` is the panel
+    already placed at (MARGIN, MARGIN)."""
+    fields = page_fields(pw, ph)
+    dims_parts = [fields["dims"]]
+    if extra_dims:
+        dims_parts.append(extra_dims)
+
+    return _PAGE_TMPL.format_map({
+        **fields, "title": title, "panel": panel_el,
+        "dims": "\n    ".join(dims_parts),
+    })
+
+
 def generate_print_html():
+    m = MARGIN
     pages = []
 
     # 1. Front plate
     pages.append(panel_page(
         f"Front Plate  {OW:.0f} x {OH:.0f} mm",
-        front_plate, OW, OH,
+        front_plate(m, m), OW, OH,
     ))
 
     # 2. Back plate
     pages.append(panel_page(
         f"Back Plate  {BACK_W:.1f} x {BACK_H:.1f} mm",
-        back_plate, BACK_W, BACK_H,
+        back_plate(m, m), BACK_W, BACK_H,
     ))
 
     # 3. Top wall
     pages.append(panel_page(
         f"Top Wall  {OW:.0f} x {D:.0f} mm",
-        top_wall, OW, D,
+        top_wall(m, m), OW, D,
     ))
 
     # 4. Bottom wall
     pages.append(panel_page(
         f"Bottom Wall  {OW:.0f} x {D:.0f} mm  (USB-C cutout)",
-        bottom_wall, OW, D,
+        bottom_wall(m, m), OW, D,
     ))
 
     # 5. Left wall
     pages.append(panel_page(
         f"Left Wall  {OH:.0f} x {D:.0f} mm  (rail groove)",
-        left_wall, OH, D,
+        left_wall(m, m), OH, D,
     ))
 
     # 6. Right wall
     pages.append(panel_page(
         f"Right Wall  {OH:.0f} x {D:.0f} mm  (rail + button)",
-        right_wall, OH, D,
+        right_wall(m, m), OH, D,
     ))
 
     pages_html = "\n".join(
@@ -168,10 +193,15 @@ def generate_print_html():
 </html>'''
 
 
-if __name__ == "__main__":
+def main():
+    """Write enclosure_print.html."""
     html = generate_print_html()
     with open("enclosure_print.html", "w") as f:
         f.write(html)
     print("Generated enclosure_print.html")
     print("Print at 'Actual Size' (100%, no scaling) on letter paper.")
     print("Use the 50mm reference square on page 1 to verify scale.")
+
+
+if __name__ == "__main__":
+    main()
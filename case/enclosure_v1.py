@@ -8,6 +8,7 @@ Run: python3 enclosure_v1.py
 Output: enclosure_v1.svg
 """
 
+import functools
 import math
 
 # === PARAMETERS (measure your components, adjust these) ===
@@ -42,76 +43,176 @@ USB_POS = 0.7    # position along wall (0=bottom, 1=top of box)
 SCREW_D = 3.2
 SCREW_INSET = 10
 
+# Kerf compensation (mm): half the laser's cut width. Outlines grow and
+# holes shrink by this much so parts fit at nominal size. 0 = off.
+KERF = 0.0
+
 # === DERIVED ===
 OW = W + 2 * T   # outer width
 OH = H + 2 * T   # outer height
 SPACING = 15      # gap between panels in SVG layout
 
+# Draw the wall outlines once in <defs> and place them with <use>. Off by
+# default: some laser and slicer importers don't expand <use> references
+# and silently drop those walls.
+USE_SVG_DEFS = False
+
+
+def fmt(v):
+    """Format a coordinate with 2 decimals, removing trailing zeros."""
+    return f"{v:.2f}".rstrip('0').rstrip('.')
 
-def finger_edge(x1, y1, x2, y2, tabs_out=True):
-    """Generate SVG path segments for a finger-jointed edge.
+
+@functools.lru_cache(maxsize=32)
+def finger_template(length, tabs_out=True):
+    """Finger-joint corner points for an edge of the given length, in
+    edge-local coordinates: (u along the edge, v along the outward normal).
+
+    Odd number of segments >= 5; corners (even indices) are gaps so corner
+    material is preserved. Cached: only a few edge lengths occur."""
+    n = max(5, round(length / TAB_W))
+    if n % 2 == 0:
+        n += 1
+    w = length / n
+    v = T if tabs_out else -T               # tab (or slot) depth
+
+    # Active (tab or slot) segments at odd indices, each followed by a gap
+    pts = [(w, 0)]
+    for i in range(1, n, 2):
+        pts += ((i * w, v), ((i + 1) * w, v), ((i + 1) * w, 0), ((i + 2) * w, 0))
+    return tuple(pts)
+
+
+class PanelPath:
+    """Geometry of one panel as parallel lists (command, x, y),
+    formatted into SVG path data in a single pass by d(). With
+    outline=False every subpath is a hole, e.g. a standalone cutout."""
+
+    def __init__(self, outline=True):
+        self.outline = outline
+        self.cmd = []
+        self.x = []
+        self.y = []
+
+    def _add(self, cmd, x, y):
+        self.cmd.append(cmd)
+        self.x.append(x)
+        self.y.append(y)
+
+    def move(self, x, y):
+        self._add('M', x, y)
+
+    def line(self, x, y):
+        self._add('L', x, y)
+
+    def close(self):
+        self._add('Z', 0.0, 0.0)
+
+    def kerf_offset(self, kerf):
+        """Coordinates with kerf baked in: every vertex moves by `kerf` along
+        its miter, outward on the first subpath if it is the panel outline
+        and inward on the rest (holes). All subpaths are traced clockwise in
+        SVG's y-down frame, so the outward normal of (dx, dy) is (dy, -dx)."""
+        xs, ys = list(self.x), list(self.y)
+        offset, start = (kerf if self.outline else -kerf), 0
+        for i, cmd in enumerate(self.cmd):
+            if cmd == 'Z':
+                _offset_ring(xs, ys, start, i, offset)
+                offset, start = -kerf, i + 1
+        return xs, ys
+
+    def d(self):
+        """SVG path data for everything added so far."""
+        xs, ys = self.kerf_offset(KERF) if KERF else (self.x, self.y)
+        parts = []
+        for cmd, x, y in zip(self.cmd, xs, ys):
+            if cmd == 'Z':
+                parts[-1] += 'Z'
+            else:
+                parts.append(f"{cmd}{fmt(x)},{fmt(y)}")
+        return ' '.join(parts)
+
+    def to_svg(self, evenodd=False):
+        """The panel as an SVG <path> element."""
+        if evenodd:
+            return f'<path d="{self.d()}" fill-rule="evenodd"/>'
+        return f'<path d="{self.d()}"/>'
+
+
+def _offset_ring(xs, ys, start, end, offset, *, _hypot=math.hypot):
+    """Miter-offset the closed ring of points xs/ys[start:end] in place.
+    A repeated closing point is offset together with the first."""
+    last = end - 1
+    if last > start and (xs[last], ys[last]) == (xs[start], ys[start]):
+        end = last
+    pts = list(zip(xs[start:end], ys[start:end]))
+    n = len(pts)
+
+    normals = []
+    for k in range(n):
+        (x1, y1), (x2, y2) = pts[k], pts[(k + 1) % n]
+        length = _hypot(x2 - x1, y2 - y1)
+        # A zero-length edge contributes no direction
+        normals.append(((y2 - y1) / length, (x1 - x2) / length) if length else (0.0, 0.0))
+
+    for k in range(n):
+        (ax, ay), (bx, by) = normals[k - 1], normals[k]
+        denom = 1 + ax * bx + ay * by
+        if denom < 1e-9:                    # edge doubles back on itself
+            ax, ay, denom = bx, by, 2.0
+        xs[start + k] = pts[k][0] + offset * (ax + bx) / denom
+        ys[start + k] = pts[k][1] + offset * (ay + by) / denom
+
+    if end != last + 1:
+        xs[last], ys[last] = xs[start], ys[start]
+
+
+def finger_edge(path, x1, y1, x2, y2, tabs_out=True, *, _hypot=math.hypot):
+    """Add a finger-jointed edge to `path`.
 
     Edge goes from (x1,y1) to (x2,y2). For CW-traced panels,
     tabs_out=True extends tabs outward from the panel.
-    Corners are always gaps (baseline) so corner material is preserved.
+    Maps the cached finger_template onto the edge. `_hypot` is bound
+    at definition time to skip the module attribute lookup per call.
     """
     dx, dy = x2 - x1, y2 - y1
-    length = math.hypot(dx, dy)
+    length = _hypot(dx, dy)
     ux, uy = dx / length, dy / length       # unit direction
     px, py = dy / length, -dx / length      # outward perpendicular (CW)
 
-    sign = 1 if tabs_out else -1
-    tx, ty = sign * px * T, sign * py * T   # tab offset vector
+    for du, dv in finger_template(length, tabs_out):
+        path.line(x1 + ux * du + px * dv, y1 + uy * du + py * dv)
+
+
+def circle_el(cx, cy, d):
+    """SVG <circle> element for a round hole."""
+    return f'<circle cx="{fmt(cx)}" cy="{fmt(cy)}" r="{fmt(d / 2 - KERF)}"/>'
 
-    # Odd number of segments >= 5; corners (even indices) are gaps
-    n = max(5, round(length / TAB_W))
-    if n % 2 == 0:
-        n += 1
-    w = length / n
 
-    segs = []
-    for i in range(n):
-        ex = x1 + ux * (i + 1) * w
-        ey = y1 + uy * (i + 1) * w
-        if i % 2 == 1:  # active (tab or slot) at odd indices
-            sx = x1 + ux * i * w
-            sy = y1 + uy * i * w
-            segs.append(f"L{sx+tx:.2f},{sy+ty:.2f}")
-            segs.append(f"L{ex+tx:.2f},{ey+ty:.2f}")
-            segs.append(f"L{ex:.2f},{ey:.2f}")
-        else:  # gap at even indices
-            segs.append(f"L{ex:.2f},{ey:.2f}")
-    return ' '.join(segs)
-
-
-def circle_path(cx, cy, d):
-    """SVG path for a circle (two arcs)."""
-    r = d / 2
-    return (f"M{cx-r:.2f},{cy:.2f} "
-            f"A{r:.2f},{r:.2f} 0 1,0 {cx+r:.2f},{cy:.2f} "
-            f"A{r:.2f},{r:.2f} 0 1,0 {cx-r:.2f},{cy:.2f}Z")
-
-
-def rect_path(cx, cy, w, h):
-    """SVG path for a rectangle centered at (cx, cy)."""
+def rect_path(path, cx, cy, w, h):
+    """Add a rectangle centered at (cx, cy) to `path`."""
     x, y = cx - w / 2, cy - h / 2
-    return (f"M{x:.2f},{y:.2f} L{x+w:.2f},{y:.2f} "
-            f"L{x+w:.2f},{y+h:.2f} L{x:.2f},{y+h:.2f}Z")
+    path.move(x, y)
+    path.line(x + w, y)
+    path.line(x + w, y + h)
+    path.line(x, y + h)
+    path.close()
 
 
 def screw_holes(ox, oy, w, h):
     """Four corner screw holes."""
     si = SCREW_INSET
-    return ' '.join([
-        circle_path(ox + si, oy + si, SCREW_D),
-        circle_path(ox + w - si, oy + si, SCREW_D),
-        circle_path(ox + w - si, oy + h - si, SCREW_D),
-        circle_path(ox + si, oy + h - si, SCREW_D),
+    return ''.join([
+        circle_el(ox + si, oy + si, SCREW_D),
+        circle_el(ox + w - si, oy + si, SCREW_D),
+        circle_el(ox + w - si, oy + h - si, SCREW_D),
+        circle_el(ox + si, oy + h - si, SCREW_D),
     ])
 
 
 # === PANEL GENERATORS ===
-# Each returns an SVG <path> element string.
+# Each returns SVG element markup: the outline <path>, with round holes
+# as sibling <circle> elements.
 # Panels are drawn at position (ox, oy) in SVG coordinates.
 # Convention: SVG top edge = assembly back edge for wall panels.
 
@@ -119,100 +220,117 @@ def front_plate(ox, oy):
     """Front plate: plain rectangle with display window, camera hole, screws."""
     w, h = OW, OH
 
-    outline = (f"M{ox:.2f},{oy:.2f} L{ox+w:.2f},{oy:.2f} "
-               f"L{ox+w:.2f},{oy+h:.2f} L{ox:.2f},{oy+h:.2f}Z")
+    path = PanelPath()
+    path.move(ox, oy)
+    path.line(ox + w, oy)
+    path.line(ox + w, oy + h)
+    path.line(ox, oy + h)
+    path.close()
 
     dcx, dcy = ox + w / 2, oy + h / 2 + DISP_Y_OFF
-    cuts = ' '.join([
-        rect_path(dcx, dcy, DISP_W, DISP_H),
-        circle_path(ox + w / 2, oy + CAM_Y, CAM_D),
-        screw_holes(ox, oy, w, h),
-    ])
+    rect_path(path, dcx, dcy, DISP_W, DISP_H)
 
-    return f'<path d="{outline} {cuts}" fill-rule="evenodd"/>'
+    return (path.to_svg(evenodd=True)
+            + circle_el(ox + w / 2, oy + CAM_Y, CAM_D)
+            + screw_holes(ox, oy, w, h))
 
 
 def back_plate(ox, oy):
     """Back plate: finger joint slots on all 4 edges, screw holes."""
     w, h = OW, OH
 
-    path = f"M{ox:.2f},{oy:.2f}"
+    path = PanelPath()
+    path.move(ox, oy)
     # Top edge: slots (receive top wall tabs)
-    path += ' ' + finger_edge(ox, oy, ox + w, oy, tabs_out=False)
+    finger_edge(path, ox, oy, ox + w, oy, tabs_out=False)
     # Right edge: plain T, then slots for right wall, then plain T
-    path += f" L{ox+w:.2f},{oy+T:.2f}"
-    path += ' ' + finger_edge(ox + w, oy + T, ox + w, oy + T + H, tabs_out=False)
-    path += f" L{ox+w:.2f},{oy+h:.2f}"
+    path.line(ox + w, oy + T)
+    finger_edge(path, ox + w, oy + T, ox + w, oy + T + H, tabs_out=False)
+    path.line(ox + w, oy + h)
     # Bottom edge: slots (receive bottom wall tabs)
-    path += ' ' + finger_edge(ox + w, oy + h, ox, oy + h, tabs_out=False)
+    finger_edge(path, ox + w, oy + h, ox, oy + h, tabs_out=False)
     # Left edge: plain T, slots for left wall, plain T (going up)
-    path += f" L{ox:.2f},{oy+T+H:.2f}"
-    path += ' ' + finger_edge(ox, oy + T + H, ox, oy + T, tabs_out=False)
-    path += f" L{ox:.2f},{oy:.2f}"
-    path += "Z"
+    path.line(ox, oy + T + H)
+    finger_edge(path, ox, oy + T + H, ox, oy + T, tabs_out=False)
+    path.line(ox, oy)
+    path.close()
 
-    cuts = screw_holes(ox, oy, w, h)
-    return f'<path d="{path} {cuts}" fill-rule="evenodd"/>'
+    return path.to_svg() + screw_holes(ox, oy, w, h)
 
 
-def top_wall(ox, oy):
-    """Top wall (OW x D): tabs on back edge, button hole."""
-    w, h = OW, D
+def wall_outline(ox, oy, w, h):
+    """Wall outline: tabs on the top edge (= back in assembly), right,
+    bottom and left edges plain."""
+    path = PanelPath()
+    path.move(ox, oy)
+    finger_edge(path, ox, oy, ox + w, oy, tabs_out=True)
+    path.line(ox + w, oy + h)
+    path.line(ox, oy + h)
+    path.line(ox, oy)
+    path.close()
+    return path
 
-    path = f"M{ox:.2f},{oy:.2f}"
-    # Top edge (= back in assembly): tabs
-    path += ' ' + finger_edge(ox, oy, ox + w, oy, tabs_out=True)
-    # Right, bottom, left: plain
-    path += f" L{ox+w:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy:.2f}Z"
 
-    btn = circle_path(ox + w / 2, oy + h / 2, BTN_D)
-    return f'<path d="{path} {btn}" fill-rule="evenodd"/>'
+def wall_panel(ref, ox, oy, w, h):
+    """Wall outline at (ox, oy): with USE_SVG_DEFS a <use> of the shared
+    definition `ref`, otherwise an inline path."""
+    if USE_SVG_DEFS:
+        return f'<use xlink:href="#{ref}" x="{fmt(ox)}" y="{fmt(oy)}"/>'
+    return wall_outline(ox, oy, w, h).to_svg()
 
 
-def bottom_wall(ox, oy):
-    """Bottom wall (OW x D): tabs on back edge."""
+def top_wall(ox, oy):
+    """Top wall (OW x D): tabs on back edge, button hole."""
     w, h = OW, D
+    return (wall_panel('wall-OW', ox, oy, w, h)
+            + circle_el(ox + w / 2, oy + h / 2, BTN_D))
 
-    path = f"M{ox:.2f},{oy:.2f}"
-    path += ' ' + finger_edge(ox, oy, ox + w, oy, tabs_out=True)
-    path += f" L{ox+w:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy:.2f}Z"
 
-    return f'<path d="{path}"/>'
+def bottom_wall(ox, oy):
+    """Bottom wall (OW x D): tabs on back edge."""
+    return wall_panel('wall-OW', ox, oy, OW, D)
 
 
 def left_wall(ox, oy):
     """Left wall (H x D): tabs on back edge."""
-    w, h = H, D
-
-    path = f"M{ox:.2f},{oy:.2f}"
-    path += ' ' + finger_edge(ox, oy, ox + w, oy, tabs_out=True)
-    path += f" L{ox+w:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy:.2f}Z"
-
-    return f'<path d="{path}"/>'
+    return wall_panel('wall-H', ox, oy, H, D)
 
 
 def right_wall(ox, oy):
     """Right wall (H x D): tabs on back edge, USB-C cutout."""
     w, h = H, D
 
-    path = f"M{ox:.2f},{oy:.2f}"
-    path += ' ' + finger_edge(ox, oy, ox + w, oy, tabs_out=True)
-    path += f" L{ox+w:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy+h:.2f}"
-    path += f" L{ox:.2f},{oy:.2f}Z"
-
     # USB-C cutout on front edge (SVG bottom), position adjustable
+    usb = PanelPath(outline=False)
     usb_cx = ox + w * USB_POS
     usb_cy = oy + h - USB_H / 2  # flush with front edge
-    usb = rect_path(usb_cx, usb_cy, USB_W, USB_H)
+    rect_path(usb, usb_cx, usb_cy, USB_W, USB_H)
 
-    return f'<path d="{path} {usb}" fill-rule="evenodd"/>'
+    return wall_panel('wall-H', ox, oy, w, h) + usb.to_svg()
+
+
+def wall_defs():
+    """<defs> block with the shared wall outlines, drawn at the origin."""
+    if not USE_SVG_DEFS:
+        return ''
+    return (f'<defs>\n'
+            f'      <path id="wall-OW" d="{wall_outline(0, 0, OW, D).d()}"/>\n'
+            f'      <path id="wall-H" d="{wall_outline(0, 0, H, D).d()}"/>\n'
+            f'    </defs>\n    ')
+
+
+# Document envelope; filled by generate_svg with str.format_map
+_SVG_TMPL = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:xlink="http://www.w3.org/1999/xlink"
+     width="{w}mm" height="{h}mm"
+     viewBox="0 0 {w} {h}">
+  <!-- Red stroke = cut lines for laser cutter -->
+  <!-- Units: mm. Material: {T}mm wood/plywood -->
+  <g fill="none" stroke="red" stroke-width="0.1">
+    {defs}{content}
+  </g>
+</svg>'''
 
 
 def generate_svg():
@@ -253,16 +371,10 @@ def generate_svg():
 
     content = '\n    '.join(parts)
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     width="{total_w:.2f}mm" height="{total_h:.2f}mm"
-     viewBox="0 0 {total_w:.2f} {total_h:.2f}">
-  <!-- Red stroke = cut lines for laser cutter -->
-  <!-- Units: mm. Material: {T}mm wood/plywood -->
-  <g fill="none" stroke="red" stroke-width="0.1">
-    {content}
-  </g>
-</svg>'''
+    return _SVG_TMPL.format_map({
+        "w": fmt(total_w), "h": fmt(total_h), "T": T,
+        "defs": wall_defs(), "content": content,
+    })
 
 
 if __name__ == '__main__':
@@ -21,9 +21,14 @@ import os
 import sys
 import io
 import time
+import random
 import subprocess
 import select
-from PIL import Image
+import selectors
+import threading
+import queue
+from datetime import datetime
+from PIL import Image, ImageDraw, ImageFilter
 
 # TTY support - optional for systemd (headless) operation
 HAS_TTY = False
@@ -50,12 +55,46 @@ from gallery import load_dream_images, show_gallery_image
 try:
     from google import genai
     from google.genai import types
+    from google.genai import errors as genai_errors
     HAS_GENAI = True
 except ImportError:
     HAS_GENAI = False
     print("Warning: google-genai not installed")
     print("Install with: pip install google-genai pillow")
 
+# NumPy - optional, hands pixel buffers to TurboJPEG and OpenCV below.
+# Both are only used when it is available.
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# libjpeg-turbo codec - optional, SIMD (NEON) JPEG decode/encode on the Pi.
+# Falls back to Pillow when the package or the native library is missing.
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbojpeg = TurboJPEG()
+    HAS_TURBOJPEG = HAS_NUMPY
+except (ImportError, OSError, RuntimeError):
+    HAS_TURBOJPEG = False
+
+# OpenCV - optional, NEON-accelerated area-averaging resize for downscales.
+# Falls back to Pillow's Lanczos.
+try:
+    import cv2
+    HAS_CV2 = HAS_NUMPY
+except ImportError:
+    HAS_CV2 = False
+
+# Picamera2 - optional, in-process camera (ships with Raspberry Pi OS).
+# Falls back to a libcamera-vid stream.
+try:
+    from picamera2 import Picamera2
+    HAS_PICAMERA2 = True
+except ImportError:
+    HAS_PICAMERA2 = False
+
 
 # Dream styles - ordered: art filters, creative framing, fun, time/era, text modes, environments
 DREAM_STYLES = {
@@ -106,6 +145,207 @@ DREAM_STYLES = {
 
 DEFAULT_STYLE = 'clay'
 
+# Carousel order and name -> position lookup
+STYLE_NAMES = tuple(DREAM_STYLES)
+STYLE_DESCS = tuple(DREAM_STYLES.values())
+STYLE_INDEX = {name: i for i, name in enumerate(STYLE_NAMES)}
+
+# Gemini uploads: longest edge and JPEG quality. Smaller payloads upload
+# faster without hurting the model's read of the scene.
+API_MAX_EDGE = 1024
+API_JPEG_QUALITY = 85
+
+# Gemini errors worth retrying (rate limit, transient server errors), and
+# how many attempts to make with exponential backoff between them
+API_RETRY_CODES = frozenset({429, 500, 502, 503, 504})
+API_RETRY_ATTEMPTS = 3
+
+# Persistent camera stream: frame rate, and how long a capture waits for a
+# fresh frame before falling back to a one-shot libcamera-still
+VIDEO_FRAMERATE = 5
+VIDEO_FRAME_TIMEOUT = 3.0
+
+# Button edges must be stable this long (microseconds) before lgpio reports them
+BUTTON_DEBOUNCE_US = 15000
+
+
+def with_retry(request, *args, **kwargs):
+    """Run a Gemini request, retrying rate-limit and transient server errors
+    with exponential backoff plus jitter. Other errors propagate at once."""
+    for attempt in range(API_RETRY_ATTEMPTS):
+        try:
+            return request(*args, **kwargs)
+        except genai_errors.APIError as e:
+            if e.code not in API_RETRY_CODES or attempt == API_RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(2 ** attempt + random.random())
+
+
+def decode_jpeg(data):
+    """Decode JPEG bytes (or any bytes-like buffer) to an RGB PIL Image."""
+    if HAS_TURBOJPEG:
+        return Image.fromarray(_turbojpeg.decode(data, pixel_format=TJPF_RGB))
+    return Image.open(io.BytesIO(data))
+
+
+def to_gray(image, size):
+    """Convert to 8-bit grayscale and resize to `size` (w, h) for display."""
+    gray = image.convert('L')
+    if gray.size == size:
+        return gray
+    if HAS_CV2:
+        # Area averaging for downscales; it degrades to blocky output when
+        # enlarging (e.g. a smaller Gemini image), so use cubic there
+        shrink = size[0] <= gray.width and size[1] <= gray.height
+        interp = cv2.INTER_AREA if shrink else cv2.INTER_CUBIC
+        return Image.fromarray(cv2.resize(np.asarray(gray), size, interpolation=interp))
+    return gray.resize(size, Image.Resampling.LANCZOS)
+
+
+def encode_jpeg(image, quality=90):
+    """Encode a PIL Image as JPEG bytes (for Gemini uploads)."""
+    rgb = image.convert('RGB')
+    if HAS_TURBOJPEG:
+        return _turbojpeg.encode(np.asarray(rgb), quality=quality, pixel_format=TJPF_RGB)
+    buf = io.BytesIO()
+    rgb.save(buf, format='JPEG', quality=quality)
+    return buf.getvalue()
+
+
+# Per-pixel steps for _fused_point: a fixed 256-entry table, or a function
+# of the current histogram for steps that depend on the image
+
+_invert = [255 - v for v in range(256)]
+
+
+def _solarize(threshold):
+    return [255 - v if v >= threshold else v for v in range(256)]
+
+
+def _posterize(bits):
+    mask = ~(2 ** (8 - bits) - 1) & 0xFF
+    return [v & mask for v in range(256)]
+
+
+def _contrast(factor):
+    """Like ImageEnhance.Contrast: blend towards the mean gray level."""
+    def lut(hist):
+        mean = int(sum(v * n for v, n in enumerate(hist)) / sum(hist) + 0.5)
+        return [min(255, max(0, int(mean + factor * (v - mean)))) for v in range(256)]
+    return lut
+
+
+def _autocontrast(hist):
+    """Like ImageOps.autocontrast: stretch the used range to 0-255."""
+    used = [v for v, n in enumerate(hist) if n]
+    lo, hi = used[0], used[-1]
+    if hi <= lo:
+        return list(range(256))
+    scale = 255.0 / (hi - lo)
+    offset = -lo * scale
+    return [min(255, max(0, int(v * scale + offset))) for v in range(256)]
+
+
+def _fused_point(img, *steps):
+    """Apply a chain of per-pixel steps to an 'L' image in one point() pass,
+    tracking the histogram through each step instead of the pixels. Chains
+    of fixed tables skip the histogram pass entirely."""
+    hist = img.histogram() if any(callable(step) for step in steps) else None
+    table = list(range(256))
+    for step in steps:
+        lut = step(hist) if callable(step) else step
+        table = [lut[v] for v in table]
+        if hist is not None:
+            mapped = [0] * 256
+            for v, n in enumerate(hist):
+                mapped[lut[v]] += n
+            hist = mapped
+    return img.point(table)
+
+
+# Fallback dream kernels: one per style, each taking and returning an 'L' image.
+# Consecutive per-pixel steps are fused into a single lookup-table pass.
+
+def _k_identity(img):
+    return img
+
+
+def _k_surreal(img):
+    # Solarize + emboss for weird dreamlike effect
+    img = _fused_point(img, _solarize(128))
+    img = img.filter(ImageFilter.EMBOSS)
+    return _fused_point(img, _autocontrast)
+
+
+def _k_nightmare(img):
+    # Invert + find edges + high contrast
+    img = _fused_point(img, _invert)
+    img = img.filter(ImageFilter.FIND_EDGES)
+    return _fused_point(img, _contrast(3.0))
+
+
+def _k_dreamy(img):
+    # Heavy blur + posterize for soft dream effect
+    img = img.filter(ImageFilter.GaussianBlur(5))
+    return _fused_point(img, _posterize(3), _contrast(1.5))
+
+
+def _k_noir(img):
+    # High contrast + edge detection
+    return _fused_point(img, _contrast(3.0), _posterize(2))
+
+
+def _k_sketch(img):
+    # Edge detection + invert for pencil sketch look
+    img = img.filter(ImageFilter.FIND_EDGES)
+    return _fused_point(img, _invert, _contrast(2.0))
+
+
+def _k_vintage(img):
+    # Posterize + slight blur for old photo look
+    img = _fused_point(img, _posterize(4))
+    return img.filter(ImageFilter.SMOOTH)
+
+
+def _k_minimal(img):
+    # Strong contour for line art
+    img = img.filter(ImageFilter.CONTOUR)
+    return _fused_point(img, _invert, _autocontrast)
+
+
+def _k_cyberpunk(img):
+    # Emboss + solarize for digital glitch feel
+    img = img.filter(ImageFilter.EMBOSS)
+    return _fused_point(img, _solarize(100), _contrast(2.0))
+
+
+def _k_anime(img):
+    # Posterize heavily for cel-shaded look
+    img = _fused_point(img, _posterize(2))
+    return img.filter(ImageFilter.EDGE_ENHANCE_MORE)
+
+
+def _k_abstract(img):
+    # Multiple filters for chaotic effect
+    img = img.filter(ImageFilter.EMBOSS)
+    img = _fused_point(img, _posterize(2))
+    img = img.filter(ImageFilter.FIND_EDGES)
+    return _fused_point(img, _invert)
+
+
+_FALLBACK_KERNELS = {
+    'surreal': _k_surreal,
+    'nightmare': _k_nightmare,
+    'dreamy': _k_dreamy,
+    'noir': _k_noir,
+    'sketch': _k_sketch,
+    'vintage': _k_vintage,
+    'minimal': _k_minimal,
+    'cyberpunk': _k_cyberpunk,
+    'anime': _k_anime,
+    'abstract': _k_abstract,
+}
+
 
 class DreamCamera:
     """AI-powered camera that reimagines what it sees."""
@@ -118,7 +358,23 @@ class DreamCamera:
         self.height = self.display.height
         self.save_dir = save_dir
         self.last_image = None  # Store last displayed image
+        self.last_image_bytes = None  # ...and its display-ready grayscale bytes
+        self.last_image_size = None
+        self._side_cache = None  # (original, resized half-width grayscale)
+
+        # The spinner has only 8 distinct frames (45 degree steps) - render once
+        self._spinner_frames = [self.get_spinner_region(i).tobytes() for i in range(8)]
         self.capture_count = 0  # Track captures for auto-reset
+        self._api_jpeg_cache = None  # (image, bytes) of the last upload encode
+
+        # Keep the camera running so captures skip the sensor start-up
+        self._picam = None
+        self._video = None
+        self._frame = None
+        self._frame_seq = 0
+        self._frame_cond = threading.Condition()
+        if not self._start_picamera():
+            self._start_video()
 
         # Create save directory if specified
         if self.save_dir:
@@ -142,7 +398,6 @@ class DreamCamera:
         if not self.save_dir:
             return None, None
 
-        from datetime import datetime
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
 
         orig_path = os.path.join(self.save_dir, f"{timestamp}_original.jpg")
@@ -155,19 +410,32 @@ class DreamCamera:
         print(f"\rSaved: {os.path.basename(dream_path)}\r\n", end='', flush=True)
         return orig_path, dream_path
 
+    def _api_jpeg(self, image):
+        """JPEG bytes of an image for a Gemini upload, downscaled to
+        API_MAX_EDGE. The last encode is kept so repeated calls for the
+        same frame don't re-encode it."""
+        # Read the cache once: stream_dreams' producer thread replaces it
+        cached = self._api_jpeg_cache
+        if cached and cached[0] is image:
+            return cached[1]
+        small = image.copy()
+        small.thumbnail((API_MAX_EDGE, API_MAX_EDGE), Image.Resampling.LANCZOS)
+        image_bytes = encode_jpeg(small, quality=API_JPEG_QUALITY)
+        self._api_jpeg_cache = (image, image_bytes)
+        return image_bytes
+
     def generate_text(self, image):
         """Use Gemini to generate text about a photo (for text modes)."""
         if not self.client:
             return "AI not available"
 
-        buf = io.BytesIO()
-        image.save(buf, format='JPEG')
-        image_bytes = buf.getvalue()
+        image_bytes = self._api_jpeg(image)
 
         prompt = DREAM_STYLES[self.style]
 
         try:
-            response = self.client.models.generate_content(
+            response = with_retry(
+                self.client.models.generate_content,
                 model='gemini-2.0-flash',
                 contents=[
                     types.Content(
@@ -188,7 +456,6 @@ class DreamCamera:
         if not self.save_dir:
             return
 
-        from datetime import datetime
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
 
         orig_path = os.path.join(self.save_dir, f"{timestamp}_original.jpg")
@@ -201,19 +468,126 @@ class DreamCamera:
         print(f"\rSaved: {os.path.basename(orig_path)}\r\n", end='', flush=True)
         print(f"\rSaved: {os.path.basename(text_path)}\r\n", end='', flush=True)
 
+    def _start_picamera(self):
+        """Start the camera in-process with Picamera2. Returns False if it
+        isn't available, in which case the libcamera-vid stream is used."""
+        if not HAS_PICAMERA2:
+            return False
+        try:
+            picam = Picamera2()
+            picam.configure(picam.create_still_configuration(
+                main={'size': (self.width, self.height)}))
+            picam.start()
+        except Exception as e:
+            print(f"Picamera2 unavailable ({e}), using libcamera-vid")
+            return False
+        self._picam = picam
+        return True
+
+    def _start_video(self):
+        """Start a libcamera-vid MJPEG stream on stdout. A reader thread
+        keeps the newest complete frame in self._frame."""
+        cmd = [
+            'libcamera-vid',
+            '--codec', 'mjpeg',
+            '--width', str(self.width),
+            '--height', str(self.height),
+            '--framerate', str(VIDEO_FRAMERATE),
+            '-t', '0',
+            '--nopreview',
+            '-o', '-'
+        ]
+        try:
+            self._video = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                           stderr=subprocess.DEVNULL)
+        except OSError:
+            self._video = None
+            return
+        threading.Thread(target=self._read_video, args=(self._video,),
+                         daemon=True).start()
+
+    def _read_video(self, proc):
+        """Split the MJPEG stream into frames on the JPEG SOI/EOI markers."""
+        buf = bytearray()
+        while True:
+            chunk = proc.stdout.read1(65536)
+            if not chunk:
+                break  # EOF - stream ended
+            buf += chunk
+            while True:
+                soi = buf.find(b'\xff\xd8')
+                if soi < 0:
+                    buf.clear()
+                    break
+                eoi = buf.find(b'\xff\xd9', soi + 2)
+                if eoi < 0:
+                    del buf[:soi]
+                    break
+                frame = bytes(buf[soi:eoi + 2])
+                del buf[:eoi + 2]
+                with self._frame_cond:
+                    self._frame = frame
+                    self._frame_seq += 1
+                    self._frame_cond.notify_all()
+
+    def _stop_video(self):
+        """Stop the camera stream, if running."""
+        if self._video is not None:
+            self._video.terminate()
+            self._video.wait()
+            self._video = None
+
+    def close(self):
+        """Stop the camera and close the display."""
+        if self._picam is not None:
+            self._picam.close()
+            self._picam = None
+        self._stop_video()
+        self.display.close()
+
+    def _video_frame(self):
+        """JPEG bytes of the first stream frame completed after this call,
+        or None if streaming isn't available."""
+        if self._video is None:
+            return None
+        if self._video.poll() is not None:
+            # Stream died - restart it
+            self._start_video()
+            if self._video is None:
+                return None
+
+        with self._frame_cond:
+            seq = self._frame_seq
+            fresh = self._frame_cond.wait_for(lambda: self._frame_seq > seq,
+                                              timeout=VIDEO_FRAME_TIMEOUT)
+            frame = self._frame
+        if not fresh:
+            print("\rCamera stream stalled, using libcamera-still\r\n", end='', flush=True)
+            self._stop_video()
+            return None
+        return frame
+
     def capture_photo(self):
-        """Capture a photo using libcamera."""
-        tmp_path = '/tmp/capture.jpg'
+        """Capture a photo from the running camera (Picamera2 or the
+        libcamera-vid stream), otherwise with a one-shot libcamera-still."""
+        if self._picam is not None:
+            return self._picam.capture_image('main')
+
+        frame = self._video_frame()
+        if frame is not None:
+            return decode_jpeg(frame)
+
         cmd = [
             'libcamera-still',
-            '-o', tmp_path,
+            '-o', '-',
             '--width', str(self.width),
             '--height', str(self.height),
             '-t', '1',
             '--nopreview'
         ]
-        subprocess.run(cmd, capture_output=True)
-        return Image.open(tmp_path)
+        # JPEG comes back on stdout - no temp file
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        return decode_jpeg(result.stdout)
 
     def describe_person(self, image):
         """Use Gemini to describe the person in the image."""
@@ -221,9 +595,7 @@ class DreamCamera:
             return "a person"
 
         # Convert PIL image to bytes
-        buf = io.BytesIO()
-        image.save(buf, format='JPEG')
-        image_bytes = buf.getvalue()
+        image_bytes = self._api_jpeg(image)
 
         prompt = """Describe the person in this photo in detail for image generation.
         Include: their apparent age, gender, ethnicity, hair (color, style, length),
@@ -232,7 +604,8 @@ class DreamCamera:
         Only describe the PERSON, not the background."""
 
         try:
-            response = self.client.models.generate_content(
+            response = with_retry(
+                self.client.models.generate_content,
                 model='gemini-2.0-flash',
                 contents=[
                     types.Content(
@@ -249,15 +622,15 @@ class DreamCamera:
             return "a person"
 
     # Art styles that transform the whole image (vs environment styles that change background)
-    ART_STYLES = {
+    ART_STYLES = frozenset({
         'clay', 'pencil', 'sharpie', 'lineart', 'charcoal', 'watercolor', 'comic', 'pixel', 'sculpture', 'woodcut',
         'wanted', 'card', 'newspaper', 'poster', 'album',
         'lego', 'stained', 'tattoo',
         'victorian', 'renaissance', 'future',
-    }
+    })
 
     # Text modes - AI generates text, not images
-    TEXT_MODES = {'describe', 'poem', 'haiku', 'roast', 'fortune', 'story'}
+    TEXT_MODES = frozenset({'describe', 'poem', 'haiku', 'roast', 'fortune', 'story'})
 
     def dream_image(self, image, quiet=False):
         """
@@ -275,9 +648,7 @@ class DreamCamera:
         if self.client:
             try:
                 # Convert image to bytes
-                buf = io.BytesIO()
-                image.save(buf, format='JPEG')
-                image_bytes = buf.getvalue()
+                image_bytes = self._api_jpeg(image)
 
                 if is_art_style:
                     # Art style - transform the entire image
@@ -294,108 +665,68 @@ Only change the background/environment around them. Make it look like a real pho
 photorealistic, professional photography quality. The person should look naturally composited
 into the new scene with proper lighting and shadows."""
 
-                response = self.client.models.generate_content(
-                    model='nano-banana-pro-preview',
-                    contents=[
-                        types.Content(
-                            role='user',
-                            parts=[
-                                types.Part.from_bytes(data=image_bytes, mime_type='image/jpeg'),
-                                types.Part.from_text(text=prompt),
-                            ]
-                        )
-                    ],
-                    config=types.GenerateContentConfig(
-                        response_modalities=['image', 'text'],
-                    )
-                )
-                # Extract image from response
-                for part in response.candidates[0].content.parts:
-                    if hasattr(part, 'inline_data') and part.inline_data:
-                        img_bytes = part.inline_data.data
-                        return Image.open(io.BytesIO(img_bytes))
+                dreamed = with_retry(self._generate_image, image_bytes, prompt)
+                if dreamed is not None:
+                    return dreamed
             except Exception as e:
                 if not quiet:
                     print(f"  Image generation error: {e}\r")
 
         # Fallback: apply filters to original
-        return self._fallback_dream(image, description)
-
-    def _fallback_dream(self, image, description):
+        return self._fallback_dream(image)
+
+    def _generate_image(self, image_bytes, prompt):
+        """One image-generation request. Returns the first image in the
+        response, or None if it contains no image."""
+        stream = self.client.models.generate_content_stream(
+            model='nano-banana-pro-preview',
+            contents=[
+                types.Content(
+                    role='user',
+                    parts=[
+                        types.Part.from_bytes(data=image_bytes, mime_type='image/jpeg'),
+                        types.Part.from_text(text=prompt),
+                    ]
+                )
+            ],
+            config=types.GenerateContentConfig(
+                response_modalities=['image', 'text'],
+            )
+        )
+        # Take the image from the first chunk that carries one,
+        # without waiting for any trailing text to finish streaming
+        for chunk in stream:
+            if not chunk.candidates or not chunk.candidates[0].content:
+                continue
+            for part in chunk.candidates[0].content.parts or ():
+                inline = getattr(part, 'inline_data', None)
+                if inline and inline.data:
+                    # Decode now, on the worker thread and inside the
+                    # caller's try, rather than lazily on first pixel access
+                    dreamed = Image.open(io.BytesIO(inline.data))
+                    dreamed.load()
+                    return dreamed
+        return None
+
+    def _fallback_dream(self, image):
         """
         Fallback when Imagen isn't available.
         Apply dramatic artistic transformations.
+
+        Each style maps to a kernel in _FALLBACK_KERNELS; styles without one
+        come back as plain grayscale.
         """
-        from PIL import ImageFilter, ImageEnhance, ImageOps
-        import random
-
-        img = image.convert('L')  # Grayscale first
-
-        # Apply dramatic style-based filters
-        if self.style == 'surreal':
-            # Solarize + emboss for weird dreamlike effect
-            img = ImageOps.solarize(img, threshold=128)
-            img = img.filter(ImageFilter.EMBOSS)
-            img = ImageOps.autocontrast(img)
-
-        elif self.style == 'nightmare':
-            # Invert + find edges + high contrast
-            img = ImageOps.invert(img)
-            img = img.filter(ImageFilter.FIND_EDGES)
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(3.0)
-
-        elif self.style == 'dreamy':
-            # Heavy blur + posterize for soft dream effect
-            img = img.filter(ImageFilter.GaussianBlur(5))
-            img = ImageOps.posterize(img, 3)
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.5)
-
-        elif self.style == 'noir':
-            # High contrast + edge detection
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(3.0)
-            img = ImageOps.posterize(img, 2)
-
-        elif self.style == 'sketch':
-            # Edge detection + invert for pencil sketch look
-            img = img.filter(ImageFilter.FIND_EDGES)
-            img = ImageOps.invert(img)
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(2.0)
-
-        elif self.style == 'vintage':
-            # Posterize + slight blur for old photo look
-            img = ImageOps.posterize(img, 4)
-            img = img.filter(ImageFilter.SMOOTH)
-
-        elif self.style == 'minimal':
-            # Strong contour for line art
-            img = img.filter(ImageFilter.CONTOUR)
-            img = ImageOps.invert(img)
-            img = ImageOps.autocontrast(img)
-
-        elif self.style == 'cyberpunk':
-            # Emboss + solarize for digital glitch feel
-            img = img.filter(ImageFilter.EMBOSS)
-            img = ImageOps.solarize(img, threshold=100)
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(2.0)
-
-        elif self.style == 'anime':
-            # Posterize heavily for cel-shaded look
-            img = ImageOps.posterize(img, 2)
-            img = img.filter(ImageFilter.EDGE_ENHANCE_MORE)
-
-        elif self.style == 'abstract':
-            # Multiple filters for chaotic effect
-            img = img.filter(ImageFilter.EMBOSS)
-            img = ImageOps.posterize(img, 2)
-            img = img.filter(ImageFilter.FIND_EDGES)
-            img = ImageOps.invert(img)
-
-        return img
+        return _FALLBACK_KERNELS.get(self.style, _k_identity)(image.convert('L'))
+
+    def side_original(self, original):
+        """The original resized to the left half of a side-by-side image.
+        Kept for the last photo, so it can be prepared while the dream is
+        still being generated and reused if shown side by side again."""
+        if self._side_cache and self._side_cache[0] is original:
+            return self._side_cache[1]
+        orig_resized = to_gray(original, (self.width // 2, self.height))
+        self._side_cache = (original, orig_resized)
+        return orig_resized
 
     def make_side_by_side(self, original, dreamed):
         """Create a side-by-side comparison image."""
@@ -404,28 +735,28 @@ into the new scene with proper lighting and shadows."""
         h = self.height
 
         # Resize both images to fit
-        orig_resized = original.convert('L').resize((half_w, h), Image.Resampling.LANCZOS)
-        dream_resized = dreamed.convert('L').resize((half_w, h), Image.Resampling.LANCZOS)
+        orig_resized = self.side_original(original)
+        dream_resized = to_gray(dreamed, (half_w, h))
 
         # Create combined image
         combined = Image.new('L', (self.width, h), 255)
         combined.paste(orig_resized, (0, 0))
         combined.paste(dream_resized, (half_w, 0))
 
-        # Add divider line
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(combined)
-        draw.line([(half_w, 0), (half_w, h)], fill=0, width=3)
+        # Add divider line (3px black column, filled directly)
+        combined.paste(0, (half_w - 1, 0, half_w + 2, h))
 
         return combined
 
+    def show_last_image(self):
+        """Redisplay the last dream from its cached grayscale bytes."""
+        self.display.show_raw(self.last_image_bytes, self.last_image_size, mode=MODE_GC16)
+
     # Spinner size constant
     SPINNER_SIZE = 120
 
     def get_spinner_region(self, frame):
         """Create a spinning circle indicator."""
-        from PIL import ImageDraw
-        import math
         region = Image.new('L', (self.SPINNER_SIZE, self.SPINNER_SIZE), 255)
         draw = ImageDraw.Draw(region)
 
@@ -447,14 +778,14 @@ into the new scene with proper lighting and shadows."""
 
     def dream_and_display(self, side_by_side=False):
         """Capture, dream, and display with loading animation."""
-        import threading
-
         print("\rCapturing...\r\n", end='', flush=True)
         photo = self.capture_photo()
 
-        # Show photo immediately
-        photo_gray = photo.convert('L').resize((self.width, self.height))
-        self.display.show_image(photo_gray, mode=MODE_A2)
+        # Show photo immediately. A2 only draws black and white, so dither
+        # the preview ourselves rather than letting the panel threshold it.
+        photo_bw = to_gray(photo, (self.width, self.height)).convert(
+            '1', dither=Image.Dither.FLOYDSTEINBERG).convert('L')
+        self.display.show_raw(photo_bw.tobytes(), photo_bw.size, mode=MODE_A2)
 
         # Text modes: generate text instead of image
         if self.style in self.TEXT_MODES:
@@ -478,8 +809,7 @@ into the new scene with proper lighting and shadows."""
             start = time.time()
             frame = 0
             while thread.is_alive():
-                spinner = self.get_spinner_region(frame)
-                self.display.display(spinner.tobytes(), x=spinner_x, y=spinner_y,
+                self.display.display(self._spinner_frames[frame & 7], x=spinner_x, y=spinner_y,
                                     w=self.SPINNER_SIZE, h=self.SPINNER_SIZE, mode=MODE_A2)
                 frame += 1
                 time.sleep(0.2)
@@ -495,6 +825,7 @@ into the new scene with proper lighting and shadows."""
             self.screen.show_text_result(self.style, text)
             self.save_text_result(photo, text)
             self.last_image = None  # Text modes don't produce gallery images
+            self.last_image_bytes = None
             self.capture_count += 1
             print("\rDone!\r\n", end='', flush=True)
             return
@@ -517,6 +848,10 @@ into the new scene with proper lighting and shadows."""
         thread = threading.Thread(target=process)
         thread.start()
 
+        if side_by_side:
+            # Resize the original half now, while Gemini works
+            self.side_original(photo)
+
         # Animate spinner while waiting (partial refresh only)
         print("\rProcessing with AI...\r\n", end='', flush=True)
         start = time.time()
@@ -524,8 +859,7 @@ into the new scene with proper lighting and shadows."""
 
         while thread.is_alive():
             # Update just the spinner region (partial refresh)
-            spinner = self.get_spinner_region(frame)
-            self.display.display(spinner.tobytes(), x=spinner_x, y=spinner_y,
+            self.display.display(self._spinner_frames[frame & 7], x=spinner_x, y=spinner_y,
                                 w=self.SPINNER_SIZE, h=self.SPINNER_SIZE, mode=MODE_A2)
             frame += 1
             time.sleep(0.2)
@@ -547,10 +881,13 @@ into the new scene with proper lighting and shadows."""
         if side_by_side:
             final_image = self.make_side_by_side(photo, dreamed)
         else:
-            final_image = dreamed.convert('L').resize((self.width, self.height), Image.Resampling.LANCZOS)
-
+            # Full refresh: the dithered A2 preview differs almost everywhere,
+            # so a partial one would cover the whole frame anyway
+            final_image = to_gray(dreamed, (self.width, self.height))
         self.display.show_image(final_image, mode=MODE_GC16)
         self.last_image = final_image  # Store for style banner restore
+        self.last_image_bytes = final_image.tobytes()
+        self.last_image_size = final_image.size
         self.capture_count += 1
         print("\rDone!\r\n", end='', flush=True)
 
@@ -559,27 +896,83 @@ into the new scene with proper lighting and shadows."""
             print("\r[Auto-reset to prevent freeze]\r\n", end='', flush=True)
             self.display.reset()
             if self.last_image:
-                self.display.show_image(self.last_image, mode=MODE_GC16)
+                self.show_last_image()
 
     def stream_dreams(self):
-        """Continuous dream streaming."""
+        """Continuous dream streaming.
+
+        Capture (and upload encode) runs in a producer thread so the next
+        frame is ready while the current one is being dreamed. The producer
+        holds at most one frame and waits for it to be taken before
+        capturing again; a capture error ends the stream. Dreams are pushed to
+        the panel from a display thread, so the next Gemini request starts
+        while the previous result is still refreshing."""
         print("Streaming dreams (press any key to stop)...\r")
+        frames = queue.Queue(maxsize=1)
+        results = queue.Queue(maxsize=1)
+        stop = threading.Event()
+
+        def hand_over(item):
+            # Block until the dream loop takes the frame, but notice a stop
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def produce():
+            try:
+                while not stop.is_set():
+                    photo = self.capture_photo()
+                    self._api_jpeg(photo)  # encode ahead of the upload
+                    hand_over(photo)
+            except Exception as e:
+                hand_over(e)  # re-raised by the dream loop
+
+        def show():
+            while True:
+                dreamed = results.get()
+                if dreamed is None:
+                    break
+                try:
+                    self.display.show_image(dreamed, mode=MODE_A2)
+                except Exception as e:
+                    # Keep draining so the dream loop never blocks on us
+                    print(f"\r\n  Display error: {e}\r")
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        shower = threading.Thread(target=show, daemon=True)
+        shower.start()
+
         frame = 0
         start = time.time()
+        try:
+            while True:
+                # Check for keypress
+                if self._key_pressed():
+                    break
 
-        while True:
-            # Check for keypress
-            if self._key_pressed():
-                break
-
-            photo = self.capture_photo()
-            dreamed = self.dream_image(photo, quiet=True)
-            self.display.show_image(dreamed, mode=MODE_A2)
+                try:
+                    photo = frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if isinstance(photo, Exception):
+                    print(f"\r\n  Capture error: {photo}\r")
+                    raise photo
+                dreamed = self.dream_image(photo, quiet=True)
+                results.put(dreamed)  # Waits if the last one is still showing
 
-            frame += 1
-            elapsed = time.time() - start
-            # Clear line and print status
-            print(f"\r\033[KFrame {frame} ({frame/elapsed:.2f} fps)   ", end='', flush=True)
+                frame += 1
+                elapsed = time.time() - start
+                # Clear line and print status
+                print(f"\r\033[KFrame {frame} ({frame/elapsed:.2f} fps)   ", end='', flush=True)
+        finally:
+            stop.set()
+            results.put(None)
+            shower.join()
+            producer.join()
 
         print(f"\r\n\033[KStreamed {frame} dreams\r")
 
@@ -591,9 +984,7 @@ into the new scene with proper lighting and shadows."""
 
     def cycle_style(self):
         """Cycle to next dream style (keyboard shortcut)."""
-        styles = list(DREAM_STYLES.keys())
-        idx = styles.index(self.style)
-        self.style = styles[(idx + 1) % len(styles)]
+        self.style = STYLE_NAMES[(STYLE_INDEX[self.style] + 1) % len(STYLE_NAMES)]
         print(f"\rStyle: {self.style}\r\n\r  {DREAM_STYLES[self.style][:50]}...\r\n", end='', flush=True)
 
     def _enter_image_mode(self, mode):
@@ -638,8 +1029,28 @@ into the new scene with proper lighting and shadows."""
         else:
             print("(No TTY - GPIO-only mode)")
 
+        # The main loop sleeps on stdin and a wakeup pipe that button edges
+        # write to, instead of spinning
+        sel = selectors.DefaultSelector()
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_w, False)
+        sel.register(wake_r, selectors.EVENT_READ)
+        if HAS_TTY:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+
+        btn_level = [1]  # Debounced button level, kept by the edge callback
+
+        def on_button_edge(chip, gpio, level, tick):
+            if level < 2:  # 2 is a watchdog timeout, not an edge
+                btn_level[0] = level
+            try:
+                os.write(wake_w, b'1')
+            except BlockingIOError:
+                pass  # A wakeup is already pending
+
         # Set up GPIO button
         gpio_chip = None
+        gpio_cb = None
         if gpio_pin is not None:
             try:
                 import lgpio
@@ -647,7 +1058,14 @@ into the new scene with proper lighting and shadows."""
                     gpio_chip = lgpio.gpiochip_open(4)  # Pi 5
                 except:
                     gpio_chip = lgpio.gpiochip_open(0)  # Older Pi
-                lgpio.gpio_claim_input(gpio_chip, gpio_pin, lgpio.SET_PULL_UP)
+                try:
+                    lgpio.gpio_claim_alert(gpio_chip, gpio_pin, lgpio.BOTH_EDGES, lgpio.SET_PULL_UP)
+                    lgpio.gpio_set_debounce_micros(gpio_chip, gpio_pin, BUTTON_DEBOUNCE_US)
+                    btn_level[0] = lgpio.gpio_read(gpio_chip, gpio_pin)
+                    gpio_cb = lgpio.callback(gpio_chip, gpio_pin, lgpio.BOTH_EDGES, on_button_edge)
+                except Exception:
+                    # No edge alerts: fall back to polling the pin
+                    lgpio.gpio_claim_input(gpio_chip, gpio_pin, lgpio.SET_PULL_UP)
                 print(f"  Button on GPIO{gpio_pin} ready!")
             except Exception as e:
                 print(f"  GPIO setup failed: {e}")
@@ -688,10 +1106,6 @@ into the new scene with proper lighting and shadows."""
         style_browse_last_advance = 0
         style_before_browse = None
 
-        # Style data
-        style_names = list(DREAM_STYLES.keys())
-        style_descs = list(DREAM_STYLES.values())
-
         # Set terminal to raw mode if TTY available
         old_settings = None
         if HAS_TTY:
@@ -701,6 +1115,32 @@ into the new scene with proper lighting and shadows."""
                 tty.setraw(sys.stdin.fileno())
 
             while True:
+                # Sleep until a key, a button edge or the next deadline the
+                # loop acts on. Deadlines already passed were handled (or
+                # don't apply, e.g. a hold while browsing styles).
+                now = time.time()
+                deadlines = [now + 1.0]
+                if gpio_chip is not None and gpio_cb is None:
+                    deadlines.append(now + 0.05)  # No edge alerts: poll the pin
+                if mode == 'slideshow' and gallery_images and not slideshow_paused:
+                    deadlines.append(last_advance + 60)
+                if style_browsing:
+                    deadlines.append(style_browse_last_advance + 2.0)
+                if mode_carousel_active:
+                    deadlines.append(mode_carousel_last_advance + 2.0)
+                elif last_btn == 0:
+                    deadlines.append(btn_time + 1.5)  # Hold opens the mode carousel
+                if click_count > 0:
+                    deadlines.append(last_click_time + 0.41)  # Click timeout is > 0.4s
+                timeout = min([d for d in deadlines if d > now]) - now
+
+                key_ready = False
+                for sel_key, _ in sel.select(timeout):
+                    if sel_key.fd == wake_r:
+                        os.read(wake_r, 64)
+                    else:
+                        key_ready = True
+
                 now = time.time()
 
                 # Slideshow auto-advance
@@ -712,13 +1152,13 @@ into the new scene with proper lighting and shadows."""
 
                 # Style browsing auto-advance (every 2s)
                 if style_browsing and now - style_browse_last_advance >= 2.0:
-                    style_browse_idx = (style_browse_idx + 1) % len(style_names)
+                    style_browse_idx = (style_browse_idx + 1) % len(STYLE_NAMES)
                     style_browse_last_advance = now
                     self.screen.show_style_carousel(
-                        style_names, style_descs, style_browse_idx)
+                        STYLE_NAMES, STYLE_DESCS, style_browse_idx)
 
                 # Keyboard (TTY only)
-                if HAS_TTY and select.select([sys.stdin], [], [], 0.05)[0]:
+                if key_ready:
                     key = sys.stdin.read(1)
 
                     if key == 'q':
@@ -727,7 +1167,7 @@ into the new scene with proper lighting and shadows."""
                     elif key == '1' or key == ' ':
                         # Click action
                         if style_browsing:
-                            self.style = style_names[style_browse_idx]
+                            self.style = STYLE_NAMES[style_browse_idx]
                             style_browsing = False
                             print(f"\r\n[Style: {self.style}]\r\n", end='', flush=True)
                             self.screen.show_capture_mode()
@@ -754,11 +1194,11 @@ into the new scene with proper lighting and shadows."""
                         elif mode == 'capture':
                             style_browsing = True
                             style_before_browse = self.style
-                            style_browse_idx = style_names.index(self.style)
+                            style_browse_idx = STYLE_INDEX[self.style]
                             style_browse_last_advance = now
                             print("\r\n[Style browse]\r\n", end='', flush=True)
                             self.screen.show_style_carousel(
-                                style_names, style_descs, style_browse_idx,
+                                STYLE_NAMES, STYLE_DESCS, style_browse_idx,
                                 first_frame=True)
                         elif mode == 'gallery' and gallery_images:
                             gallery_idx = (gallery_idx - 1) % len(gallery_images)
@@ -770,7 +1210,7 @@ into the new scene with proper lighting and shadows."""
                         if next_mode == 'capture':
                             mode = 'capture'
                             if self.last_image:
-                                self.display.show_image(self.last_image, mode=MODE_GC16)
+                                self.show_last_image()
                             else:
                                 self.screen.show_capture_mode()
                         else:
@@ -800,8 +1240,10 @@ into the new scene with proper lighting and shadows."""
 
                 # GPIO button state machine
                 if gpio_chip is not None:
-                    import lgpio
-                    state = lgpio.gpio_read(gpio_chip, gpio_pin)
+                    if gpio_cb is not None:
+                        state = btn_level[0]
+                    else:
+                        state = lgpio.gpio_read(gpio_chip, gpio_pin)
 
                     if not mode_carousel_active:
                         if last_btn == 1 and state == 0:
@@ -845,7 +1287,7 @@ into the new scene with proper lighting and shadows."""
                                 # Same mode - return to current view
                                 if mode == 'capture':
                                     if self.last_image:
-                                        self.display.show_image(self.last_image, mode=MODE_GC16)
+                                        self.show_last_image()
                                     else:
                                         self.screen.show_capture_mode()
                                 elif gallery_images:
@@ -854,7 +1296,7 @@ into the new scene with proper lighting and shadows."""
                                 mode = 'capture'
                                 print("\r\n[Capture]\r\n", end='', flush=True)
                                 if self.last_image:
-                                    self.display.show_image(self.last_image, mode=MODE_GC16)
+                                    self.show_last_image()
                                 else:
                                     self.screen.show_capture_mode()
                             elif mode in ('gallery', 'slideshow') and selected in ('gallery', 'slideshow'):
@@ -881,12 +1323,15 @@ into the new scene with proper lighting and shadows."""
 
                     last_btn = state
 
-                    # Click timeout - process pending clicks
-                    if not mode_carousel_active and click_count > 0 and now - last_click_time > 0.4:
+                    # Click timeout - process pending clicks. Slideshow has no
+                    # double-click action, so a click there fires on release.
+                    wait_for_double = style_browsing or mode != 'slideshow'
+                    if (not mode_carousel_active and click_count > 0 and
+                            (now - last_click_time > 0.4 or not wait_for_double)):
                         if click_count == 1:
                             # Single click
                             if style_browsing:
-                                self.style = style_names[style_browse_idx]
+                                self.style = STYLE_NAMES[style_browse_idx]
                                 style_browsing = False
                                 print(f"\r\n[Style: {self.style}]\r\n", end='', flush=True)
                                 self.screen.show_capture_mode()
@@ -914,11 +1359,11 @@ into the new scene with proper lighting and shadows."""
                             elif mode == 'capture':
                                 style_browsing = True
                                 style_before_browse = self.style
-                                style_browse_idx = style_names.index(self.style)
+                                style_browse_idx = STYLE_INDEX[self.style]
                                 style_browse_last_advance = now
                                 print("\r\n[Style browse]\r\n", end='', flush=True)
                                 self.screen.show_style_carousel(
-                                    style_names, style_descs, style_browse_idx,
+                                    STYLE_NAMES, STYLE_DESCS, style_browse_idx,
                                     first_frame=True)
                             elif mode == 'gallery' and gallery_images:
                                 gallery_idx = (gallery_idx - 1) % len(gallery_images)
@@ -926,17 +1371,17 @@ into the new scene with proper lighting and shadows."""
 
                         click_count = 0
 
-                # Avoid busy loop when no input sources
-                if not HAS_TTY and gpio_chip is None:
-                    time.sleep(0.05)
-
         finally:
             if old_settings is not None:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+            if gpio_cb is not None:
+                gpio_cb.cancel()
             if gpio_chip is not None:
-                import lgpio
                 lgpio.gpiochip_close(gpio_chip)
-            self.display.close()
+            sel.close()
+            os.close(wake_r)
+            os.close(wake_w)
+            self.close()
 
 
 def run_button_mode(camera, gpio_pin=17, side_by_side=False):
@@ -955,29 +1400,29 @@ def run_button_mode(camera, gpio_pin=17, side_by_side=False):
     except:
         chip = lgpio.gpiochip_open(0)  # Older Pi
 
-    # Set up pin as input with pull-up resistor
-    lgpio.gpio_claim_input(chip, gpio_pin, lgpio.SET_PULL_UP)
+    # Set up pin with pull-up resistor, alerting on debounced presses
+    # (falling edge: high when released, low when pressed)
+    lgpio.gpio_claim_alert(chip, gpio_pin, lgpio.FALLING_EDGE, lgpio.SET_PULL_UP)
+    lgpio.gpio_set_debounce_micros(chip, gpio_pin, BUTTON_DEBOUNCE_US)
+    pressed = threading.Event()
+    cb = lgpio.callback(chip, gpio_pin, lgpio.FALLING_EDGE,
+                        lambda chip, gpio, level, tick: pressed.set())
 
     shot_count = 0
-    last_state = 1  # Pull-up means high when not pressed
 
     try:
         while True:
-            state = lgpio.gpio_read(chip, gpio_pin)
-
-            # Button pressed (falling edge: was high, now low)
-            if last_state == 1 and state == 0:
-                shot_count += 1
-                print(f"\n[Shot {shot_count}] Button pressed!")
-                camera.dream_and_display(side_by_side=side_by_side)
-                print("Ready for next shot...")
-
-            last_state = state
-            time.sleep(0.05)  # 50ms debounce
+            pressed.wait()
+            shot_count += 1
+            print(f"\n[Shot {shot_count}] Button pressed!")
+            camera.dream_and_display(side_by_side=side_by_side)
+            pressed.clear()  # Ignore presses made while dreaming
+            print("Ready for next shot...")
 
     except KeyboardInterrupt:
         print(f"\n\nExiting. Took {shot_count} dream shots.")
     finally:
+        cb.cancel()
         lgpio.gpiochip_close(chip)
 
 
@@ -988,7 +1433,7 @@ def main():
     parser.add_argument('--once', action='store_true', help='Take one dream photo and exit (no interactive mode)')
     parser.add_argument('--gpio', type=int, default=17, help='GPIO pin for button (default: 17)')
     parser.add_argument('--no-button', action='store_true', help='Disable physical button')
-    parser.add_argument('--style', choices=list(DREAM_STYLES.keys()), default=DEFAULT_STYLE, help='Dream style/environment')
+    parser.add_argument('--style', choices=STYLE_NAMES, default=DEFAULT_STYLE, help='Dream style/environment')
     parser.add_argument('--side-by-side', action='store_true', help='Show original and dream side by side')
     parser.add_argument('--save', metavar='DIR', default='./dreams', help='Save images to directory (default: ./dreams)')
     parser.add_argument('--no-save', action='store_true', help='Disable auto-saving images')
@@ -1019,7 +1464,7 @@ def main():
         # Non-interactive mode - just take one photo and dream it
         print(f"Style: {camera.style}")
         camera.dream_and_display(side_by_side=args.side_by_side)
-        camera.display.close()
+        camera.close()
     else:
         # Interactive mode - keyboard + button (button enabled by default)
         gpio_pin = None if args.no_button else args.gpio
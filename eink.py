@@ -156,12 +156,14 @@ def scsi_command(fd, cmd_bytes, data_in=None, data_out_len=0, timeout=10000):
         ]
 
     # Prepare buffers
-    cmd = (ctypes.c_ubyte * len(cmd_bytes))(*cmd_bytes)
+    cmd = (ctypes.c_ubyte * len(cmd_bytes)).from_buffer_copy(cmd_bytes)
     sense = (ctypes.c_ubyte * 32)()
 
     if data_in is not None:
         direction = SG_DXFER_TO_DEV
-        data = (ctypes.c_ubyte * len(data_in))(*data_in)
+        # from_buffer_copy is a single memcpy; unpacking the bytes into the
+        # array constructor costs milliseconds per 60KB chunk
+        data = (ctypes.c_ubyte * len(data_in)).from_buffer_copy(data_in)
         data_len = len(data_in)
     elif data_out_len > 0:
         direction = SG_DXFER_FROM_DEV
@@ -291,13 +293,15 @@ class EInkDisplay:
 
         self._display_area(x, y, w, h, mode)
 
-    def show_image(self, image, mode=MODE_GC16):
+    def render(self, image):
         """
-        Display a PIL Image or image file.
+        Convert an image to display-sized 8-bit grayscale bytes.
 
         Args:
             image: PIL Image, file path, or bytes
-            mode: Refresh mode
+
+        Returns:
+            Raw bytes ready for display() / show_raw()
         """
         if isinstance(image, str):
             img = Image.open(image)
@@ -306,11 +310,37 @@ class EInkDisplay:
         else:
             img = image
 
+        if img is not image:
+            # Freshly opened file: let a JPEG decode straight to grayscale at
+            # the smallest DCT scale (1/2, 1/4, 1/8) still >= the display size
+            img.draft('L', (self.width, self.height))
+
         # Convert and resize
         img = img.convert('L')  # Grayscale
         img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        return img.tobytes()
 
-        self.display(img.tobytes(), mode=mode)
+    def show_image(self, image, mode=MODE_GC16):
+        """
+        Display a PIL Image or image file.
+
+        Args:
+            image: PIL Image, file path, or bytes
+            mode: Refresh mode
+        """
+        self.display(self.render(image), mode=mode)
+
+    def show_raw(self, image_data, size=None, mode=MODE_GC16):
+        """
+        Display pre-rendered 8-bit grayscale bytes, skipping PIL conversion.
+
+        Args:
+            image_data: Raw 8-bit grayscale bytes (1 byte per pixel)
+            size: (width, height) of the data, defaults to full display
+            mode: Refresh mode
+        """
+        w, h = size or (self.width, self.height)
+        self.display(image_data, w=w, h=h, mode=mode)
 
     def show_image_fast(self, image):
         """Display image using fast A2 mode (for video/animation)."""
@@ -318,7 +348,7 @@ class EInkDisplay:
 
     def clear(self, mode=MODE_INIT):
         """Clear display to white."""
-        white = bytes([0xFF] * (self.width * self.height))
+        white = b'\xff' * (self.width * self.height)
         self.display(white, mode=mode)
 
     def reset(self):
@@ -48,19 +48,17 @@ def create_test_pattern(width, height):
 def capture_and_display(display):
     """Capture a photo and display it."""
     print("Capturing photo...")
-    tmp_path = '/tmp/test_capture.jpg'
-
-    subprocess.run([
+    result = subprocess.run([
         'libcamera-still',
-        '-o', tmp_path,
+        '-o', '-',
         '--width', str(display.width),
         '--height', str(display.height),
         '-t', '1',
         '--nopreview'
-    ], capture_output=True)
+    ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
 
     print("Displaying...")
-    display.show_image(tmp_path, mode=MODE_GC16)
+    display.show_image(result.stdout, mode=MODE_GC16)
     print("Done!")
 
 
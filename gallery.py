@@ -3,6 +3,8 @@
 
 import os
 import glob as _glob
+import threading
+from collections import OrderedDict
 
 from eink import MODE_GC16, MODE_INIT
 
@@ -10,6 +12,13 @@ from eink import MODE_GC16, MODE_INIT
 GALLERY_REFRESH_INTERVAL = 6
 _gallery_frame_count = 0
 
+# Recently shown/prefetched images, as display-ready bytes keyed by path
+GALLERY_CACHE_SIZE = 8
+_gallery_cache = OrderedDict()
+_gallery_cache_lock = threading.Lock()
+# Paths being decoded right now, so a second caller waits instead of redoing it
+_gallery_pending = {}
+
 
 def load_dream_images(dreams_dir):
     """Load dream images (excluding originals), newest first."""
@@ -21,6 +30,43 @@ def load_dream_images(dreams_dir):
     return images
 
 
+def _screen_bytes(display, path):
+    """Display-ready bytes for `path`, decoded and resized at most once while cached."""
+    while True:
+        with _gallery_cache_lock:
+            data = _gallery_cache.get(path)
+            if data is not None:
+                _gallery_cache.move_to_end(path)
+                return data
+            pending = _gallery_pending.get(path)
+            if pending is None:
+                pending = _gallery_pending[path] = threading.Event()
+                break
+        # Being decoded by another thread (e.g. the prefetch); wait for it.
+        # If that decode failed, the next pass decodes here and raises.
+        pending.wait()
+    try:
+        data = display.render(path)
+        with _gallery_cache_lock:
+            _gallery_cache[path] = data
+            while len(_gallery_cache) > GALLERY_CACHE_SIZE:
+                _gallery_cache.popitem(last=False)
+    finally:
+        with _gallery_cache_lock:
+            del _gallery_pending[path]
+        pending.set()
+    return data
+
+
+def _prefetch(display, paths):
+    """Decode neighbouring images in the background while the panel refreshes."""
+    for path in paths:
+        try:
+            _screen_bytes(display, path)
+        except Exception:
+            pass  # Reported when actually shown
+
+
 def show_gallery_image(display, images, idx):
     """Display image at index. Full clear every N frames to prevent ghosting."""
     global _gallery_frame_count
@@ -28,11 +74,17 @@ def show_gallery_image(display, images, idx):
     total = len(images)
     print(f"\r  {idx+1}/{total}: {name}\r\n", end='', flush=True)
     try:
+        data = _screen_bytes(display, images[idx])
+        if total > 1:
+            neighbours = {images[(idx + 1) % total], images[(idx - 1) % total]}
+            threading.Thread(target=_prefetch, args=(display, neighbours),
+                             daemon=True).start()
+
         # Periodic full refresh to clear ghosting artifacts
         if _gallery_frame_count % GALLERY_REFRESH_INTERVAL == 0:
             display.clear(MODE_INIT)
         _gallery_frame_count += 1
-        display.show_image(images[idx], mode=MODE_GC16)
+        display.show_raw(data, mode=MODE_GC16)
         return True
     except Exception:
         print(f"\r  (skipping corrupt file)\r\n", end='', flush=True)
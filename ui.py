@@ -10,10 +10,14 @@ from eink import MODE_A2, MODE_GC16, MODE_INIT
 class ScreenRenderer:
     """Renders text screens and overlays on the e-ink display."""
 
+    # Rendered text screens kept for reuse (each is a full display frame)
+    SCREEN_CACHE_SIZE = 6
+
     def __init__(self, display):
         self.display = display
         self.width = display.width
         self.height = display.height
+        self._screens = {}  # (title, subtitle, body) -> rendered display bytes
         self._load_fonts()
 
     def _load_fonts(self):
@@ -55,6 +59,16 @@ class ScreenRenderer:
         """General centered text screen. Full clear first to prevent ghosting."""
         self.display.clear(MODE_INIT)
 
+        key = (title, subtitle, body)
+        data = self._screens.get(key)
+        if data is None:
+            if len(self._screens) >= self.SCREEN_CACHE_SIZE:
+                del self._screens[next(iter(self._screens))]  # Oldest first
+            data = self._screens[key] = self._render_screen(title, subtitle, body)
+        self.display.show_raw(data, mode=mode)
+
+    def _render_screen(self, title, subtitle, body):
+        """Render a text screen to display-ready grayscale bytes."""
         img = Image.new('L', (self.width, self.height), 255)
         draw = ImageDraw.Draw(img)
 
@@ -70,7 +84,7 @@ class ScreenRenderer:
             draw.text((self.width // 2, y_title + 180), body,
                       anchor="mm", font=self.font_small, fill=100)
 
-        self.display.show_image(img, mode=mode)
+        return img.tobytes()
 
     def show_splash(self, text="Digital Polaroid", duration=2.5):
         """Timed splash screen."""